@@ -2,8 +2,9 @@ import streamlit as st
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils.data_loader import load_data
-from utils.data_processing import preprocess_data
+from utils.data_loader import load_count_cube
+from utils import tracing
+from utils.tracing import start_rerun
 import datetime
 
 st.set_page_config(
@@ -11,19 +12,28 @@ st.set_page_config(
     layout="wide"
 )
 
+# =============================
+# 🩺 HIDDEN DIAGNOSTICS (?diagnostics=1, tracing on)
+# =============================
+if tracing.ENABLED and st.query_params.get("diagnostics") == "1":
+    import runpy
+    runpy.run_path(os.path.join(os.path.dirname(os.path.abspath(__file__)), "diagnostics.py"))
+    st.stop()
+
+start_rerun("Home")
+
 st.title("🚀 CareerIQ – AI Based Career Advisory System")
 st.markdown("Modular AI Career Intelligence Platform")
 
-df = load_data()
-df = preprocess_data(df)
+cube = load_count_cube()
 
 st.divider()
 
 col1, col2, col3 = st.columns(3)
 
-col1.metric("Total Jobs", len(df))
-col2.metric("Unique Roles", df["job_group"].nunique())
-col3.metric("Locations Covered", df["clean_location"].nunique())
+col1.metric("Total Jobs", cube.total())
+col2.metric("Unique Roles", cube.nunique("job_group"))
+col3.metric("Locations Covered", cube.nunique("clean_location"))
 
 st.divider()
 
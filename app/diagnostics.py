@@ -0,0 +1,93 @@
+import json
+import pandas as pd
+import streamlit as st
+from utils import tracing
+from utils.insights import INSIGHT_CACHE
+
+# Hidden diagnostics view: not a page, so it never shows in the sidebar.
+# app.py renders it for "?diagnostics=1" when the app runs with
+# CAREERIQ_TRACE=1, e.g. http://localhost:8501/?diagnostics=1
+
+st.title("🩺 Diagnostics")
+
+st.markdown("Span timings, cache counters and memory per rerun for this server process.")
+st.divider()
+
+# =============================
+# RECENT RERUNS
+# =============================
+reruns = pd.DataFrame(tracing.reruns())
+
+if reruns.empty:
+    st.warning("No reruns recorded yet. Open another page first.")
+    st.stop()
+
+pages = ["All Pages"] + sorted(reruns["page"].unique())
+page_filter = st.sidebar.selectbox("Page", pages)
+page = None if page_filter == "All Pages" else page_filter
+
+if page:
+    reruns = reruns[reruns["page"] == page]
+
+k1, k2, k3 = st.columns(3)
+k1.metric("Reruns", len(reruns))
+k2.metric("p95 Rerun", f"{reruns['duration_ms'].quantile(0.95):.1f} ms")
+k3.metric("Memory Growth", f"{reruns['rss_delta_mb'].sum():.1f} MB")
+
+st.subheader("⏱️ Span Timings")
+span_stats = pd.DataFrame(tracing.span_stats(page))
+st.dataframe(span_stats.round(2), use_container_width=True, hide_index=True)
+
+st.subheader("🔁 Recent Reruns")
+st.dataframe(
+    reruns.sort_values("id", ascending=False).round(2),
+    use_container_width=True,
+    hide_index=True
+)
+
+# =============================
+# CACHES
+# =============================
+st.divider()
+st.subheader("🗃️ Caches")
+
+counters = tracing.counters()
+cache_rows = []
+for name in sorted({key.split(".", 1)[1] for key in counters if key.startswith("cache_call.")}):
+    calls = counters.get(f"cache_call.{name}", 0)
+    misses = counters.get(f"cache_miss.{name}", 0)
+    cache_rows.append({
+        "cache": name,
+        "calls": calls,
+        "misses": misses,
+        "hit_rate": (calls - misses) / calls if calls else None,
+        "artifact_hits": counters.get(f"artifact_hit.{name}", 0),
+        "artifact_builds": counters.get(f"artifact_build.{name}", 0),
+    })
+
+st.dataframe(pd.DataFrame(cache_rows), use_container_width=True, hide_index=True)
+st.caption(f"Insight cache: {INSIGHT_CACHE.stats()}")
+
+# =============================
+# EXPORT
+# =============================
+st.divider()
+c1, c2, c3 = st.columns(3)
+
+c1.download_button(
+    "⬇️ Spans (JSON lines)",
+    tracing.to_jsonl(),
+    file_name="careeriq_spans.jsonl",
+    mime="application/x-ndjson"
+)
+
+c2.download_button(
+    "⬇️ Chrome Trace",
+    json.dumps(tracing.to_chrome_trace()),
+    file_name="careeriq_trace.json",
+    mime="application/json"
+)
+
+if c3.button("🧹 Reset"):
+    tracing.reset()
+    st.rerun()
@@ -0,0 +1,128 @@
+import argparse
+import datetime
+import os
+import sys
+import time
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from utils.data_loader import BASE_DIR, dataset_version, load_count_cube
+from utils.insights import get_insight, normalize_filters
+from utils.whatsapp_utils import TWILIO_WHATSAPP_FROM, get_delivery_queue
+
+# -----------------------------
+# Subscriber list
+# One row per subscriber: phone, roles, locations. Roles and locations are
+# "|"-separated; empty means "all".
+#   phone,roles,locations
+#   whatsapp:+910000000000,Data Scientist|ML Engineer,Bengaluru
+# -----------------------------
+SUBSCRIBERS_PATH = os.path.join(BASE_DIR, "Data", "Subscribers", "subscribers.csv")
+
+
+def split_values(value):
+    return [v.strip() for v in str(value).split("|") if v.strip()]
+
+
+def load_subscribers(path=SUBSCRIBERS_PATH):
+    subscribers = pd.read_csv(path, dtype=str, keep_default_na=False)
+    subscribers["signature"] = [
+        normalize_filters({"job_group": split_values(roles), "clean_location": split_values(locations)})
+        for roles, locations in zip(subscribers["roles"], subscribers["locations"])
+    ]
+    return subscribers
+
+
+# Groups subscribers by normalized filter signature, computes each group's
+# insight once and fans the rendered message out to the delivery queue
+def run_digest(subscribers_path=SUBSCRIBERS_PATH, dry_run=False, wait_timeout=600):
+    start = time.perf_counter()
+    subscribers = load_subscribers(subscribers_path)
+    cube = load_count_cube()
+    version = dataset_version()
+
+    compute_start = time.perf_counter()
+    outgoing = []
+    groups = 0
+    no_data = 0
+    for signature, group in subscribers.groupby("signature", sort=False):
+        groups += 1
+        insight = get_insight(cube, version, dict(signature))
+        if insight["message"] is None:
+            no_data += len(group)
+            continue
+        outgoing.extend((TWILIO_WHATSAPP_FROM, phone, insight["message"]) for phone in group["phone"])
+    compute_seconds = time.perf_counter() - compute_start
+
+    # Wait only on the messages this run queued; other runs or retries
+    # sharing the outbox must not hold up (or end) this report
+    counts = {}
+    timed_out = False
+    if outgoing and not dry_run:
+        queue = get_delivery_queue()
+        ids = queue.enqueue_many(outgoing)
+        deadline = time.monotonic() + wait_timeout
+        while True:
+            counts = queue.outbox.status_counts(ids)
+            if counts.get("pending", 0) + counts.get("sending", 0) == 0:
+                break
+            if time.monotonic() >= deadline:
+                timed_out = True
+                break
+            time.sleep(0.5)
+
+    return {
+        "subscribers": len(subscribers),
+        "groups": groups,
+        "computations_saved": len(subscribers) - groups,
+        "no_data": no_data,
+        "messages": len(outgoing),
+        "delivered": counts.get("sent", 0),
+        "failed": counts.get("failed", 0),
+        "still_pending": counts.get("pending", 0) + counts.get("sending", 0),
+        "timed_out": timed_out,
+        "compute_seconds": compute_seconds,
+        "wall_seconds": time.perf_counter() - start,
+    }
+
+
+def seconds_until(daily_at):
+    now = datetime.datetime.now()
+    hour, minute = map(int, daily_at.split(":"))
+    next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if next_run <= now:
+        next_run += datetime.timedelta(days=1)
+    return (next_run - now).total_seconds()
+
+
+def print_report(report):
+    print("✅ Digest run completed")
+    print(f"👥 Subscribers: {report['subscribers']}  filter groups: {report['groups']}")
+    print(f"♻️ Insight computations saved by grouping: {report['computations_saved']}")
+    print(f"📨 Messages queued: {report['messages']}  (no data for {report['no_data']} subscribers)")
+    print(f"📬 Delivered: {report['delivered']}  failed: {report['failed']}  "
+          f"still pending: {report['still_pending']}")
+    print(f"⏱️ Compute: {report['compute_seconds']:.3f}s  end-to-end: {report['wall_seconds']:.2f}s")
+    if report["timed_out"]:
+        print("⚠️ Timed out waiting for delivery; pending messages stay in the outbox")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Send daily WhatsApp market digests to subscribers")
+    parser.add_argument("--subscribers", default=SUBSCRIBERS_PATH)
+    parser.add_argument("--dry-run", action="store_true",
+                        help="compute and report without queueing messages")
+    parser.add_argument("--daily-at", metavar="HH:MM",
+                        help="keep running and send every day at this local time")
+    parser.add_argument("--wait-timeout", type=float, default=600,
+                        help="seconds to wait for this run's messages to be delivered; "
+                             "exits with status 1 if some are still pending")
+    args = parser.parse_args()
+
+    while True:
+        if args.daily_at:
+            time.sleep(seconds_until(args.daily_at))
+        report = run_digest(args.subscribers, args.dry_run, args.wait_timeout)
+        print_report(report)
+        if not args.daily_at:
+            sys.exit(1 if report["timed_out"] else 0)
@@ -1,13 +1,16 @@
 import streamlit as st
-import plotly.express as px
-from utils.data_loader import load_data
-from utils.data_processing import preprocess_data
+from utils.data_loader import load_count_cube, load_experience_index, load_filter_index
+from utils.data_processing import EXPERIENCE_ORDER
+from utils.tracing import span, start_rerun
+
+start_rerun("Dashboard")
 
 # =============================
 # 📂 LOAD & PREPROCESS DATA
 # =============================
-df = load_data()
-df = preprocess_data(df)
+cube = load_count_cube()
+filter_index = load_filter_index()
+experience_index = load_experience_index()
 
 st.title("📊 CareerIQ – Market Dashboard")
 st.markdown("Analyze hiring trends across Data, AI, ML & Cloud roles.")
@@ -26,21 +29,30 @@ st.sidebar.header("Filters")
 
 job_group_filter = st.sidebar.multiselect(
     "Job Role",
-    sorted(df["job_group"].dropna().unique())
+    cube.values("job_group")
 )
 
 location_filter = st.sidebar.multiselect(
     "Location",
-    sorted(df["clean_location"].dropna().unique())
+    cube.values("clean_location")
 )
 
-filtered_df = df.copy()
+experience_range = st.sidebar.slider(
+    "Your Experience (years)",
+    0, 30, (0, 30),
+    help="Counts jobs whose experience range overlaps yours"
+)
 
-if job_group_filter:
-    filtered_df = filtered_df[filtered_df["job_group"].isin(job_group_filter)]
+filters = {
+    "job_group": job_group_filter,
+    "clean_location": location_filter
+}
+filtered_count = cube.total(**filters)
 
-if location_filter:
-    filtered_df = filtered_df[filtered_df["clean_location"].isin(location_filter)]
+# Jobs open to the chosen years: interval lookup ANDed with the filters
+open_count = filter_index.count(
+    filter_index.select(**filters) & experience_index.select(*experience_range)
+)
 
 # =============================
 # 📌 FILTER SUMMARY
@@ -53,18 +65,20 @@ st.info(f"Showing results for **{selected_roles}** in **{selected_locations}**")
 # =============================
 # 📈 KPI SECTION
 # =============================
-k1, k2, k3 = st.columns(3)
+k1, k2, k3, k4 = st.columns(4)
 
-k1.metric("📌 Total Jobs", len(filtered_df))
-k2.metric("💼 Unique Roles", filtered_df["job_group"].nunique())
-k3.metric("🌍 Active Locations", filtered_df["clean_location"].nunique())
+k1.metric("📌 Total Jobs", filtered_count)
+k2.metric("💼 Unique Roles", cube.nunique("job_group", **filters))
+k3.metric("🌍 Active Locations", cube.nunique("clean_location", **filters))
+k4.metric("🧑‍💼 Open to Your Experience", open_count)
 
 st.divider()
 
 # =============================
 # 📊 MARKET STATUS
 # =============================
-market_ratio = len(filtered_df) / len(df) if len(df) > 0 else 0
+total_count = cube.total()
+market_ratio = filtered_count / total_count if total_count > 0 else 0
 
 if market_ratio > 0.4:
     market_status = "🟢 Strong Hiring Market"
@@ -78,30 +92,33 @@ st.success(f"Market Status: {market_status}")
 # =============================
 # 📊 CHARTS
 # =============================
+import plotly.express as px
+
 col1, col2 = st.columns(2)
 
 with col1:
     st.subheader("📈 Job Demand by Role")
-    role_counts = filtered_df["job_group"].value_counts().reset_index()
+    role_counts = cube.counts_by("job_group", **filters).reset_index()
     role_counts.columns = ["Role", "Jobs"]
 
-    fig1 = px.bar(role_counts, x="Role", y="Jobs", text="Jobs")
-    fig1.update_layout(height=350 if screenshot_mode else 450)
-    st.plotly_chart(fig1, use_container_width=True)
+    with span("chart", chart="role_demand"):
+        fig1 = px.bar(role_counts, x="Role", y="Jobs", text="Jobs")
+        fig1.update_layout(height=350 if screenshot_mode else 450)
+        st.plotly_chart(fig1, use_container_width=True)
 
 with col2:
     st.subheader("🌍 Jobs by Location")
     loc_counts = (
-        filtered_df["clean_location"]
-        .value_counts()
+        cube.counts_by("clean_location", **filters)
         .head(6)
         .reset_index()
     )
     loc_counts.columns = ["Location", "Jobs"]
 
-    fig2 = px.pie(loc_counts, names="Location", values="Jobs", hole=0.45)
-    fig2.update_layout(height=350 if screenshot_mode else 450)
-    st.plotly_chart(fig2, use_container_width=True)
+    with span("chart", chart="location_share"):
+        fig2 = px.pie(loc_counts, names="Location", values="Jobs", hole=0.45)
+        fig2.update_layout(height=350 if screenshot_mode else 450)
+        st.plotly_chart(fig2, use_container_width=True)
 
 st.divider()
 
@@ -110,27 +127,30 @@ st.divider()
 # =============================
 st.subheader("📊 Experience Demand Overview")
 
-exp_order = ["0-1", "1-2", "2-5", "5-10", "10+"]
-
 exp_counts = (
-    filtered_df["experience"]
-    .value_counts()
-    .reindex(exp_order, fill_value=0)
+    cube.counts_by("experience", sort=False, **filters)
+    .reindex(EXPERIENCE_ORDER, fill_value=0)
     .reset_index()
 )
 
 exp_counts.columns = ["Experience", "Jobs"]
 
-fig3 = px.bar(
-    exp_counts,
-    x="Jobs",
-    y="Experience",
-    orientation="h",
-    text="Jobs"
-)
+with span("chart", chart="experience"):
+    fig3 = px.bar(
+        exp_counts,
+        x="Jobs",
+        y="Experience",
+        orientation="h",
+        text="Jobs"
+    )
 
-fig3.update_layout(height=350 if screenshot_mode else 450)
-st.plotly_chart(fig3, use_container_width=True)
+    fig3.update_layout(height=350 if screenshot_mode else 450)
+    st.plotly_chart(fig3, use_container_width=True)
+
+st.caption(
+    "Each job is counted in the bucket of its experience range's midpoint "
+    "(3-12 years -> 5-10); open-ended ranges such as 10+ by their minimum."
+)
 
 # =============================
 # 🎯 CAREER INSIGHT
@@ -138,16 +158,16 @@ st.plotly_chart(fig3, use_container_width=True)
 st.divider()
 st.subheader("🎯 Career Insight")
 
-if not filtered_df.empty:
-    top_role = filtered_df["job_group"].value_counts().idxmax()
-    top_city = filtered_df["clean_location"].value_counts().idxmax()
-    top_exp = filtered_df["experience"].value_counts().idxmax()
+if filtered_count:
+    top_role = cube.top("job_group", **filters)
+    top_city = cube.top("clean_location", **filters)
+    top_exp = cube.top("experience", **filters)
+    exp_line = f"**Experience Sweet Spot:** {top_exp} years  \n" if top_exp else ""
 
     st.markdown(f"""
 **Most In-Demand Role:** {top_role}  
 **Top Hiring City:** {top_city}  
-**Experience Sweet Spot:** {top_exp} years  
-
+{exp_line}
 💡 Build strong projects aligned with this demand trend.
 """)
 else:
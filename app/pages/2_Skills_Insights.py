@@ -1,13 +1,18 @@
 import streamlit as st
-import plotly.express as px
-from utils.data_loader import load_data
-from utils.data_processing import preprocess_data
+from utils.data_loader import (
+    load_filter_index, load_processed_data, load_skill_graph, load_skill_matrix
+)
+from utils.tracing import span, start_rerun
+
+start_rerun("Skills Insights")
 
 # =============================
 # 📂 LOAD DATA
 # =============================
-df = load_data()
-df = preprocess_data(df)
+df = load_processed_data()
+filter_index = load_filter_index()
+skill_matrix = load_skill_matrix()
+skill_graph = load_skill_graph()
 
 st.title("🔧 Skills Demand Intelligence")
 st.markdown("Analyze most in-demand skills across roles.")
@@ -20,46 +25,79 @@ st.sidebar.header("Filter by Role")
 
 role_filter = st.sidebar.selectbox(
     "Select Role (Optional)",
-    ["All Roles"] + sorted(df["job_group"].dropna().unique())
+    ["All Roles"] + filter_index.values("job_group")
 )
 
-filtered_df = df.copy()
-
-if role_filter != "All Roles":
-    filtered_df = filtered_df[filtered_df["job_group"] == role_filter]
+selection = filter_index.select(
+    job_group=[role_filter] if role_filter != "All Roles" else []
+)
+filtered_count = filter_index.count(selection)
+role_mask = filter_index.mask(selection) if role_filter != "All Roles" else None
 
 # =============================
 # 📊 TOP SKILLS
 # =============================
 st.subheader("📈 Top 10 Skills in Demand")
 
-if not filtered_df.empty and "skills_extracted" in filtered_df.columns:
-
-    skills_series = (
-        filtered_df["skills_extracted"]
-        .dropna()
-        .str.lower()
-        .str.split(",")
-        .explode()
-        .str.strip()
-    )
+top_skills = skill_matrix.top_skills(10, role_mask)
 
-    skills_series = skills_series[skills_series != ""]
+if filtered_count and not top_skills.empty:
 
-    top_skills = skills_series.value_counts().head(10).reset_index()
+    top_skills = top_skills.reset_index()
     top_skills.columns = ["Skill", "Demand"]
     top_skills["Skill"] = top_skills["Skill"].str.title()
 
-    fig = px.bar(
-        top_skills,
-        x="Demand",
-        y="Skill",
-        orientation="h",
-        text="Demand"
-    )
+    import plotly.express as px
+
+    with span("chart", chart="top_skills"):
+        fig = px.bar(
+            top_skills,
+            x="Demand",
+            y="Skill",
+            orientation="h",
+            text="Demand"
+        )
+
+        fig.update_layout(height=500)
+        st.plotly_chart(fig, use_container_width=True)
+
+else:
+    st.warning("No skill data available for selected filter.")
+
+# =============================
+# 🔗 RELATED SKILLS
+# =============================
+st.divider()
+st.subheader("🔗 Skills That Go With...")
+
+graph_skills = skill_graph.skills(role_filter)
+
+if graph_skills:
+
+    chosen_skill = st.selectbox("Skill", graph_skills, format_func=str.title)
 
-    fig.update_layout(height=500)
-    st.plotly_chart(fig, use_container_width=True)
+    related = skill_graph.related(chosen_skill, 10, role_filter)
+
+    if not related.empty:
+        related["skill"] = related["skill"].str.title()
+        related["share"] = (related["share"] * 100).round(1)
+        related["lift"] = related["lift"].round(2)
+        related["pmi"] = related["pmi"].round(2)
+        related.columns = ["Skill", "Jobs Together", "% of Its Jobs", "Lift", "PMI"]
+        st.caption(
+            "Ranked by how often the skill appears in the same postings. "
+            "Lift = how many times more often the two skills appear together "
+            "than if they were unrelated."
+        )
+        st.dataframe(related, use_container_width=True, hide_index=True)
+    else:
+        st.info("No skill appears together with this one often enough.")
+
+    cluster = skill_graph.cluster(chosen_skill, role_filter)
+    if cluster:
+        st.markdown(
+            f"**Skill cluster:** {', '.join(cluster[:15]).title()}"
+        )
 
 else:
     st.warning("No skill data available for selected filter.")
@@ -70,18 +108,9 @@ else:
 st.divider()
 st.subheader("🎯 Career Recommendation")
 
-if role_filter != "All Roles" and not filtered_df.empty:
-
-    role_skills = (
-        filtered_df["skills_extracted"]
-        .dropna()
-        .str.lower()
-        .str.split(",")
-        .explode()
-        .str.strip()
-    )
+if role_filter != "All Roles" and filtered_count:
 
-    top_3 = role_skills.value_counts().head(3).index.tolist()
+    top_3 = skill_matrix.top_skills(3, role_mask).index.tolist()
 
     if top_3:
         st.success(
@@ -1,12 +1,22 @@
 import streamlit as st
-from utils.data_loader import load_data
-from utils.data_processing import preprocess_data
+from utils.data_loader import (
+    dataset_version,
+    load_filter_index,
+    load_job_query,
+    load_processed_data,
+    load_similarity_index,
+)
+from utils.export import EXPORT_FORMATS, cached_export, export_key, get_export
+from utils.tracing import start_rerun
+
+start_rerun("Data Explorer")
 
 # =============================
 # LOAD DATA
 # =============================
-df = load_data()
-df = preprocess_data(df)
+df = load_processed_data()
+filter_index = load_filter_index()
+job_query = load_job_query()
 
 st.title("📂 CareerIQ – Data Explorer")
 st.markdown("Explore structured job market intelligence data.")
@@ -19,21 +29,19 @@ st.sidebar.header("Filters")
 
 role_filter = st.sidebar.multiselect(
     "Filter by Role",
-    sorted(df["job_group"].dropna().unique())
+    filter_index.values("job_group")
 )
 
 location_filter = st.sidebar.multiselect(
     "Filter by Location",
-    sorted(df["clean_location"].dropna().unique())
+    filter_index.values("clean_location")
 )
 
-filtered_df = df.copy()
-
-if role_filter:
-    filtered_df = filtered_df[filtered_df["job_group"].isin(role_filter)]
-
-if location_filter:
-    filtered_df = filtered_df[filtered_df["clean_location"].isin(location_filter)]
+selection = filter_index.select(
+    job_group=role_filter,
+    clean_location=location_filter
+)
+filtered_count = filter_index.count(selection)
 
 # =============================
 # DATA SUMMARY
@@ -42,9 +50,9 @@ st.subheader("📊 Dataset Summary")
 
 col1, col2, col3 = st.columns(3)
 
-col1.metric("Total Records", len(filtered_df))
-col2.metric("Unique Roles", filtered_df["job_group"].nunique())
-col3.metric("Unique Locations", filtered_df["clean_location"].nunique())
+col1.metric("Total Records", filtered_count)
+col2.metric("Unique Roles", filter_index.nunique("job_group", selection))
+col3.metric("Unique Locations", filter_index.nunique("clean_location", selection))
 
 st.divider()
 
@@ -79,14 +87,78 @@ if not selected_columns:
         "experience"
     ]
 
-display_df = filtered_df[selected_columns]
-
 # =============================
 # PREVIEW
 # =============================
 with st.expander("🔍 Preview Data"):
-    st.caption("Showing first 100 rows")
-    st.dataframe(display_df.head(100), use_container_width=True, height=350)
+    p1, p2, p3 = st.columns(3)
+
+    sort_label = p1.selectbox("Sort by", ["None"] + selected_labels)
+    descending = p1.checkbox("Descending")
+    page_size = p2.selectbox("Rows per page", [25, 50, 100, 250], index=2)
+
+    total_pages = max(1, -(-filtered_count // page_size))
+    page_number = p3.number_input("Page", min_value=1, max_value=total_pages, value=1)
+
+    # Only the rows and columns of the requested page are gathered
+    page_df, total_rows = job_query.page(
+        rows=filter_index.rows(selection) if filtered_count < filter_index.n_rows else None,
+        sort_by=allowed_columns.get(sort_label),
+        ascending=not descending,
+        offset=(page_number - 1) * page_size,
+        limit=page_size,
+        columns=selected_columns
+    )
+
+    offset = (page_number - 1) * page_size
+    st.caption(
+        f"Showing rows {offset + 1 if len(page_df) else 0}–{offset + len(page_df)} "
+        f"of {total_rows} (page {page_number} of {total_pages})"
+    )
+    st.dataframe(page_df, use_container_width=True, height=350, hide_index=True)
+
+# =============================
+# SIMILAR JOBS
+# =============================
+st.divider()
+st.subheader("🧭 Similar Jobs")
+
+if page_df.empty:
+    st.info("No jobs in the current selection.")
+else:
+    # Approximate nearest neighbours on skills + title words (MinHash LSH),
+    # looked up in the index built once per dataset version
+    similarity_index = load_similarity_index()
+
+    job_row = st.selectbox(
+        "Find jobs like",
+        page_df.index.tolist(),
+        format_func=lambda row: f"{df['job_title'].iat[row]} – {df['clean_location'].iat[row]}"
+    )
+
+    s1, s2 = st.columns(2)
+    search_depth = s1.select_slider(
+        "Search depth",
+        options=[8, 16, 32],
+        value=32,
+        format_func={8: "Fast", 16: "Balanced", 32: "Thorough"}.get
+    )
+    min_similarity = s2.slider("Minimum similarity", 0.0, 1.0, 0.2, 0.05)
+
+    similar_rows, scores = similarity_index.similar(
+        job_row, k=10, bands=search_depth, min_similarity=min_similarity
+    )
+
+    if len(similar_rows):
+        similar_df, _ = job_query.page(
+            rows=similar_rows,
+            limit=len(similar_rows),
+            columns=["job_title", "job_group", "clean_location", "experience"]
+        )
+        similar_df["similarity"] = scores.round(2)
+        st.dataframe(similar_df, use_container_width=True, hide_index=True)
+    else:
+        st.info("No similar jobs found above the minimum similarity.")
 
 # =============================
 # DOWNLOAD
@@ -94,15 +166,46 @@ with st.expander("🔍 Preview Data"):
 st.divider()
 st.subheader("⬇ Download Data")
 
-csv_data = display_df.to_csv(index=False)
+# Exports are only serialized on request and cached on disk per
+# (dataset version, filters, columns, format). The file is only read into
+# the download button after "Prepare Download", and only while the export
+# still matches the current filters, columns and format.
+export_format = st.radio(
+    "Format",
+    list(EXPORT_FORMATS.keys()),
+    format_func=lambda fmt: EXPORT_FORMATS[fmt]["label"],
+    horizontal=True
+)
 
-st.download_button(
-    label="Download Filtered Dataset",
-    data=csv_data,
-    file_name="careerIQ_filtered_data.csv",
-    mime="text/csv"
+key = export_key(
+    dataset_version(),
+    {"job_group": role_filter, "clean_location": location_filter},
+    selected_columns,
+    export_format
 )
 
+if st.button("Prepare Download"):
+    with st.spinner("Preparing export..."):
+        get_export(
+            key,
+            export_format,
+            lambda: filter_index.take(df, selection)[selected_columns]
+        )
+    st.session_state["prepared_export"] = key
+
+export_file = None
+if st.session_state.get("prepared_export") == key:
+    export_file = cached_export(key, export_format)
+
+if export_file is not None:
+    with open(export_file, "rb") as f:
+        st.download_button(
+            label="Download Filtered Dataset",
+            data=f.read(),
+            file_name=f"careerIQ_filtered_data.{export_format}",
+            mime=EXPORT_FORMATS[export_format]["mime"]
+        )
+
 # =============================
 # DATA INFO
 # =============================
@@ -112,6 +215,6 @@ st.subheader("📌 Dataset Info")
 
 st.markdown(f"""
 - Original Dataset Size: **{len(df)} records**
-- Filtered Dataset Size: **{len(filtered_df)} records**
+- Filtered Dataset Size: **{filtered_count} records**
 - Available Analytical Fields: **{len(allowed_columns)}**
 """)
\ No newline at end of file
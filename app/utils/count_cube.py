@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+from utils.tracing import traced
+
+CUBE_AXES = ["job_group", "clean_location", "experience"]
+
+
+# Dense job counts indexed by (job_group, clean_location, experience).
+# Every axis has one trailing "missing" slot so rows with a null value still
+# count towards totals but never show up as a label in a group-by.
+class CountCube:
+
+    def __init__(self, labels, counts):
+        self.labels = labels
+        self.counts = counts
+        self.positions = {
+            axis: {value: i for i, value in enumerate(values)}
+            for axis, values in labels.items()
+        }
+
+    @classmethod
+    def from_frame(cls, df):
+        labels = {}
+        codes = []
+        for axis in CUBE_AXES:
+            axis_codes, uniques = pd.factorize(df[axis], sort=True)
+            labels[axis] = list(uniques)
+            codes.append(np.where(axis_codes < 0, len(uniques), axis_codes))
+
+        shape = tuple(len(labels[axis]) + 1 for axis in CUBE_AXES)
+        flat = np.ravel_multi_index(codes, shape)
+        counts = np.bincount(flat, minlength=int(np.prod(shape))).reshape(shape)
+        return cls(labels, counts)
+
+    def save(self, path):
+        arrays = {f"labels_{axis}": np.array(self.labels[axis], dtype=str) for axis in CUBE_AXES}
+        np.savez(path, counts=self.counts, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            labels = {axis: data[f"labels_{axis}"].tolist() for axis in CUBE_AXES}
+            return cls(labels, data["counts"])
+
+    def values(self, axis):
+        return list(self.labels[axis])
+
+    def _axis_mask(self, axis, selected):
+        mask = np.zeros(len(self.labels[axis]) + 1, dtype=self.counts.dtype)
+        for value in selected:
+            position = self.positions[axis].get(value)
+            if position is not None:
+                mask[position] = 1
+        return mask
+
+    def _filtered(self, filters):
+        sub = self.counts
+        for i, axis in enumerate(CUBE_AXES):
+            selected = filters.get(axis)
+            if selected:
+                shape = [1] * sub.ndim
+                shape[i] = -1
+                sub = sub * self._axis_mask(axis, selected).reshape(shape)
+        return sub
+
+    @traced("count_cube.total")
+    def total(self, **filters):
+        return int(self._filtered(filters).sum())
+
+    # Job counts per label of `axis` under the filters, zero rows dropped.
+    # Sorted by count (ties keep label order) unless sort=False.
+    @traced("count_cube.counts_by")
+    def counts_by(self, axis, sort=True, **filters):
+        i = CUBE_AXES.index(axis)
+        other_axes = tuple(j for j in range(self.counts.ndim) if j != i)
+        totals = self._filtered(filters).sum(axis=other_axes)[:-1]
+
+        counts = pd.Series(totals, index=pd.Index(self.labels[axis], name=axis), name="count")
+        counts = counts[counts > 0]
+        if sort:
+            counts = counts.sort_values(ascending=False, kind="stable")
+        return counts
+
+    def nunique(self, axis, **filters):
+        return len(self.counts_by(axis, sort=False, **filters))
+
+    def top(self, axis, **filters):
+        counts = self.counts_by(axis, **filters)
+        return counts.index[0] if len(counts) else None
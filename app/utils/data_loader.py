@@ -1,10 +1,237 @@
 import pandas as pd
+import hashlib
+import json
 import os
+import tempfile
 import streamlit as st
+from utils.data_processing import RULES_VERSION, compact_schema, preprocess_data
+from utils.count_cube import CountCube
+from utils.experience_index import ExperienceIndex
+from utils.filter_index import FilterIndex
+from utils.paging import JobTableQuery
+from utils.tracing import count, span, traced
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 DATA_PATH = os.path.join(BASE_DIR, "Data", "Processed", "jobs_master.csv")
+CACHE_DIR = os.path.join(BASE_DIR, "Data", "Processed", "cache")
+MANIFEST_PATH = os.path.join(BASE_DIR, "Data", "Processed", "manifest.json")
 
 @st.cache_data
+@traced("load_data")
 def load_data():
-    return pd.read_csv(DATA_PATH, dtype=str)
\ No newline at end of file
+    return pd.read_csv(DATA_PATH, dtype=str)
+
+
+def file_fingerprint(path):
+    stat = os.stat(path)
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+# Bumped by ml/preprocess.py whenever jobs_master.csv changes; 0 when the
+# table was produced without a manifest
+def manifest_version():
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            return json.load(f).get("version", 0)
+    except (OSError, ValueError):
+        return 0
+
+
+def dataset_version():
+    # Cheap to compute on every rerun: a stat() call and a tiny JSON read
+    key = f"{file_fingerprint(DATA_PATH)}|manifest-{manifest_version()}|rules-{RULES_VERSION}"
+    return hashlib.sha1(key.encode()).hexdigest()[:16]
+
+
+def cache_path(name, version, ext):
+    return os.path.join(CACHE_DIR, f"{name}_{version}.{ext}")
+
+
+# Unique temp file next to the cache entry; concurrent builds each write
+# their own file and the last os.replace wins
+def cache_temp_path(name, suffix):
+    with tempfile.NamedTemporaryFile(dir=CACHE_DIR, prefix=f"{name}_", suffix=suffix,
+                                     delete=False) as tmp:
+        return tmp.name
+
+
+# Drop artifacts of the same kind built for older data / rules. Temp files
+# belong to builds still in flight, and another process may have pruned
+# the same file already.
+def prune_cache(name, keep_path):
+    for file_name in os.listdir(CACHE_DIR):
+        path = os.path.join(CACHE_DIR, file_name)
+        if not file_name.startswith(f"{name}_") or ".tmp" in file_name or path == keep_path:
+            continue
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def build_processed_cache(version):
+    path = cache_path("jobs_processed", version, "parquet")
+    if os.path.exists(path):
+        return path
+
+    df = compact_schema(preprocess_data(pd.read_csv(DATA_PATH, dtype=str)))
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = cache_temp_path("jobs_processed", ".tmp")
+    try:
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    prune_cache("jobs_processed", path)
+
+    return path
+
+
+# Every cached resource is keyed on the dataset version and keeps one
+# entry, so a data, manifest or rules change evicts the superseded frame
+# and indexes instead of holding them for the life of the process
+@st.cache_resource(max_entries=1)
+def _read_processed(version):
+    # One shared frame per process instead of a fresh unpickled copy per
+    # call, so pages must not modify it in place
+    count("cache_miss.processed_data")
+    with span("read_processed"):
+        df = pd.read_parquet(build_processed_cache(version))
+        return compact_schema(df)
+
+
+# Every lookup of the shared frame goes through here, so cache calls and
+# misses can be compared
+def _processed_frame(version):
+    count("cache_call.processed_data")
+    return _read_processed(version)
+
+
+def load_processed_data():
+    return _processed_frame(dataset_version())
+
+
+@st.cache_resource(max_entries=1)
+def _build_filter_index(version):
+    count("cache_miss.filter_index")
+    return FilterIndex(_processed_frame(version))
+
+
+def load_filter_index():
+    count("cache_call.filter_index")
+    return _build_filter_index(dataset_version())
+
+
+@st.cache_resource(max_entries=1)
+def _build_experience_index(version):
+    count("cache_miss.experience_index")
+    return ExperienceIndex(_processed_frame(version))
+
+
+def load_experience_index():
+    count("cache_call.experience_index")
+    return _build_experience_index(dataset_version())
+
+
+@st.cache_resource(max_entries=1)
+def _build_job_query(version):
+    count("cache_miss.job_query")
+    return JobTableQuery(_processed_frame(version))
+
+
+def load_job_query():
+    count("cache_call.job_query")
+    return _build_job_query(dataset_version())
+
+
+# Loads a persisted .npz artifact for this dataset version, building and
+# saving it first if needed. Artifacts expose save(path) / load(path).
+def load_or_build_artifact(name, version, artifact_cls, build):
+    path = cache_path(name, version, "npz")
+    if os.path.exists(path):
+        count(f"artifact_hit.{name}")
+        with span("load_artifact", artifact=name):
+            return artifact_cls.load(path)
+
+    count(f"artifact_build.{name}")
+    with span("build_artifact", artifact=name):
+        artifact = build()
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    # Keep the .npz suffix so np.savez does not append another one
+    tmp_path = cache_temp_path(name, ".tmp.npz")
+    try:
+        artifact.save(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    prune_cache(name, path)
+    return artifact
+
+
+@st.cache_resource(max_entries=1)
+def _build_count_cube(version):
+    count("cache_miss.count_cube")
+    return load_or_build_artifact(
+        "count_cube", version, CountCube,
+        lambda: CountCube.from_frame(_processed_frame(version))
+    )
+
+
+def load_count_cube():
+    count("cache_call.count_cube")
+    return _build_count_cube(dataset_version())
+
+
+# scipy.sparse is only needed by the skills page, so it is imported here
+# rather than at module import
+@st.cache_resource(max_entries=1)
+def _build_skill_matrix(version):
+    from utils.skill_matrix import SkillMatrix
+
+    count("cache_miss.skill_matrix")
+    return load_or_build_artifact(
+        "skill_matrix", version, SkillMatrix,
+        lambda: SkillMatrix.from_frame(_processed_frame(version))
+    )
+
+
+def load_skill_matrix():
+    count("cache_call.skill_matrix")
+    return _build_skill_matrix(dataset_version())
+
+
+@st.cache_resource(max_entries=1)
+def _build_similarity_index(version):
+    from utils.similarity import SimilarJobsIndex
+
+    count("cache_miss.similarity_index")
+    return load_or_build_artifact(
+        "similarity_index", version, SimilarJobsIndex,
+        lambda: SimilarJobsIndex.from_frame(_processed_frame(version))
+    )
+
+
+def load_similarity_index():
+    count("cache_call.similarity_index")
+    return _build_similarity_index(dataset_version())
+
+
+@st.cache_resource(max_entries=1)
+def _build_skill_graph(version):
+    from utils.skill_graph import GRAPH_VERSION, SkillGraph
+
+    count("cache_miss.skill_graph")
+    return load_or_build_artifact(
+        "skill_graph", f"{version}-g{GRAPH_VERSION}", SkillGraph,
+        lambda: SkillGraph.from_matrix(
+            _build_skill_matrix(version), _processed_frame(version)["job_group"]
+        )
+    )
+
+
+def load_skill_graph():
+    count("cache_call.skill_graph")
+    return _build_skill_graph(dataset_version())
@@ -1,51 +1,126 @@
 import pandas as pd
+from utils.normalization import (
+    DEFAULT_ROLE,
+    LOCATION_PATTERNS,
+    ROLE_PATTERNS,
+    match_value,
+    normalize_job_groups,
+    normalize_locations,
+)
+from utils.tracing import traced
+
+# Bump whenever the mapping rules change, so cached processed data is rebuilt
+RULES_VERSION = 3
+
+EXPERIENCE_ORDER = ["0-1", "1-2", "2-5", "5-10", "10+"]
+# Lower edges (years) of the EXPERIENCE_ORDER buckets
+EXPERIENCE_EDGES = [0, 1, 2, 5, 10]
+# exp_max of open-ended ranges such as "10+"
+OPEN_ENDED_YEARS = 99
+
+# DS salary dataset experience levels, as (min, max) years
+EXPERIENCE_LEVELS = {
+    "EN": (0, 2),
+    "MI": (2, 5),
+    "SE": (5, 10),
+    "EX": (10, OPEN_ENDED_YEARS),
+}
+
+EXPERIENCE_RANGE = r"^(?P<min>\d{1,2})\s*(?:-\s*(?P<max>\d{1,2})|(?P<plus>\+))$"
+
+# Ranges a spreadsheet turned into dates: "5-12" was saved as 12 May, so the
+# month is the lower bound and the day the upper ("12 May" -> 5-12). A pair
+# of dates ("12 May - 21 May") is read as the span of both ranges.
+MONTHS = {
+    month: i + 1 for i, month in enumerate(
+        ["JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"]
+    )
+}
+EXPERIENCE_DATES = (
+    r"^(?P<day1>\d{1,2})\s+(?P<month1>[A-Z]{3})"
+    r"(?:\s*-\s*(?P<day2>\d{1,2})\s+(?P<month2>[A-Z]{3}))?$"
+)
+
+# Low-cardinality fields are stored as categoricals (small int codes + one
+# copy of each label); long free text is kept in Arrow-backed strings.
+CATEGORY_COLUMNS = [
+    "location", "role_category", "source_dataset", "clean_location", "job_group", "experience_raw"
+]
+TEXT_COLUMNS = ["job_title", "job_description", "skills_extracted"]
+YEAR_COLUMNS = ["exp_min", "exp_max"]
 
 def clean_location(loc):
     if pd.isna(loc):
         return None
     loc = loc.lower()
-    if "pune" in loc:
-        return "Pune"
-    if "bangalore" in loc or "bengaluru" in loc:
-        return "Bengaluru"
-    if "mumbai" in loc:
-        return "Mumbai"
-    if "hyderabad" in loc:
-        return "Hyderabad"
-    if "chennai" in loc:
-        return "Chennai"
-    if "delhi" in loc or "ncr" in loc or "gurgaon" in loc:
-        return "Delhi NCR"
-    return loc.title()
+    return match_value(loc, LOCATION_PATTERNS) or loc.title()
 
 
 def map_job_group(title):
     title = str(title).lower()
-    if "data scientist" in title:
-        return "Data Scientist"
-    if "data analyst" in title:
-        return "Data Analyst"
-    if "machine learning" in title or "ml engineer" in title:
-        return "ML Engineer"
-    if "ai engineer" in title:
-        return "AI Engineer"
-    if "data engineer" in title:
-        return "Data Engineer"
-    if "cloud" in title:
-        return "Cloud Engineer"
-    if "business analyst" in title:
-        return "Business Analyst"
-    if "software" in title or "developer" in title:
-        return "Software Engineer"
-    return "Other Roles"
+    return match_value(title, ROLE_PATTERNS) or DEFAULT_ROLE
+
+
+# Experience text ("3-6", "10+", "MI", "12 May") -> (exp_min, exp_max) in
+# whole years, as nullable Int16 Series; anything else (degrees) is <NA>
+def parse_experience(experience):
+    text = experience.astype("string").str.strip().str.upper()
+    parts = text.str.extract(EXPERIENCE_RANGE)
+
+    exp_min = pd.to_numeric(parts["min"]).astype("Int16")
+    exp_max = pd.to_numeric(parts["max"]).astype("Int16")
+    exp_max = exp_max.mask(parts["plus"].notna(), OPEN_ENDED_YEARS)
 
+    for level, (low, high) in EXPERIENCE_LEVELS.items():
+        is_level = (text == level).fillna(False)
+        exp_min = exp_min.mask(is_level, low)
+        exp_max = exp_max.mask(is_level, high)
 
+    # Only the few rows nothing else matched are tried as dates
+    dates = text[exp_min.isna()].str.extract(EXPERIENCE_DATES)
+    months = dates[["month1", "month2"]].apply(lambda column: column.map(MONTHS))
+    days = dates[["day1", "day2"]].apply(pd.to_numeric)
+    is_date = months["month1"].notna() & (months["month2"].notna() | dates["month2"].isna())
+    exp_min = exp_min.fillna(months.min(axis=1)[is_date].astype("Int16"))
+    exp_max = exp_max.fillna(days.max(axis=1)[is_date].astype("Int16"))
+
+    # "9-5" is read as 5-9
+    swap = (exp_min > exp_max).fillna(False)
+    exp_min, exp_max = exp_min.mask(swap, exp_max), exp_max.mask(swap, exp_min)
+    return exp_min, exp_max
+
+
+# Dashboard bucket of every interval, by its midpoint ("3-12" -> 7.5 ->
+# "5-10"); open-ended ranges by their minimum ("10+" -> "10+"). Every
+# canonical range keeps its own bucket.
+def experience_buckets(exp_min, exp_max):
+    exp_min = exp_min.astype("float64")
+    exp_max = exp_max.astype("float64")
+    years = exp_min.where(exp_max >= OPEN_ENDED_YEARS, (exp_min + exp_max) / 2)
+    return pd.cut(
+        years, EXPERIENCE_EDGES + [float("inf")], right=False, labels=EXPERIENCE_ORDER
+    ).astype(object)
+
+
+@traced("preprocess_data")
 def preprocess_data(df):
-    df["clean_location"] = df["location"].apply(clean_location)
-    df["job_group"] = df["job_title"].apply(map_job_group)
+    df["clean_location"] = normalize_locations(df["location"])
+    df["job_group"] = normalize_job_groups(df["job_title"])
+
+    # Every row is kept; rows without a readable range just have no
+    # interval and no bucket
+    df["experience_raw"] = df["experience"].astype("string").str.strip()
+    df["exp_min"], df["exp_max"] = parse_experience(df["experience_raw"])
+    df["experience"] = experience_buckets(df["exp_min"], df["exp_max"])
+
+    return df
+
 
-    df["experience"] = df["experience"].astype(str).str.strip()
-    valid_exp = ["0-1", "1-2", "2-5", "5-10", "10+"]
-    df = df[df["experience"].isin(valid_exp)]
+def compact_schema(df):
+    dtypes = {col: "category" for col in CATEGORY_COLUMNS if col in df.columns}
+    dtypes.update({col: "string[pyarrow]" for col in TEXT_COLUMNS if col in df.columns})
+    dtypes.update({col: "Int16" for col in YEAR_COLUMNS if col in df.columns})
+    if "experience" in df.columns:
+        dtypes["experience"] = pd.CategoricalDtype(EXPERIENCE_ORDER, ordered=True)
+    return df.astype(dtypes)
 
-    return df
\ No newline at end of file
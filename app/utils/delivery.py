@@ -0,0 +1,378 @@
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from collections import deque
+import requests
+from requests.adapters import HTTPAdapter
+from utils.tracing import span
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+OUTBOX_PATH = os.path.join(BASE_DIR, "Data", "Outbox", "whatsapp_outbox.sqlite")
+
+TWILIO_API_BASE = "https://api.twilio.com"
+
+logger = logging.getLogger(__name__)
+
+# A claimed message is another process's to send until its lease runs out;
+# only then is it taken back (the claiming worker died mid-send)
+LEASE_SECONDS = 120
+# Latest deliveries kept for the latency percentiles
+LATENCY_WINDOW = 1000
+
+
+class RetryableError(Exception):
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class PermanentError(Exception):
+    pass
+
+
+# =============================
+# TWILIO CLIENT
+# One requests.Session per sender keeps TLS connections pooled across
+# messages instead of a new client (and handshake) per send.
+# =============================
+class TwilioSender:
+
+    def __init__(self, account_sid, auth_token, base_url=TWILIO_API_BASE,
+                 pool_size=10, timeout=10):
+        self.url = f"{base_url.rstrip('/')}/2010-04-01/Accounts/{account_sid}/Messages.json"
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.auth = (account_sid, auth_token)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def send(self, from_, to, body):
+        try:
+            response = self.session.post(
+                self.url, data={"From": from_, "To": to, "Body": body}, timeout=self.timeout
+            )
+        except requests.RequestException as e:
+            raise RetryableError(str(e))
+
+        if response.status_code == 429 or response.status_code >= 500:
+            retry_after = response.headers.get("Retry-After")
+            raise RetryableError(
+                f"HTTP {response.status_code}",
+                float(retry_after) if retry_after and retry_after.isdigit() else None
+            )
+        if response.status_code >= 400:
+            raise PermanentError(f"HTTP {response.status_code}: {response.text[:200]}")
+        # Accepted but unreadable: the message may have gone out, so it is
+        # not retried
+        try:
+            return response.json()["sid"]
+        except (ValueError, KeyError, TypeError):
+            raise PermanentError(f"HTTP {response.status_code} without a message sid: "
+                                 f"{response.text[:200]}")
+
+    def close(self):
+        self.session.close()
+
+
+# =============================
+# RATE LIMITING
+# =============================
+class TokenBucket:
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# =============================
+# OUTBOX
+# Every message is persisted before it is sent, so queued and retrying
+# messages survive a restart. The app and digest_scheduler.py share the
+# file: write transactions start with BEGIN IMMEDIATE, so a claim holds the
+# write lock from the moment it looks for a due message.
+# =============================
+class Outbox:
+
+    def __init__(self, path=OUTBOX_PATH, lease_seconds=LEASE_SECONDS):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.lease_seconds = lease_seconds
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(
+            path, check_same_thread=False, isolation_level="IMMEDIATE", timeout=30
+        )
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS messages (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    to_number TEXT NOT NULL,
+                    from_number TEXT NOT NULL,
+                    body TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL,
+                    created_at REAL NOT NULL,
+                    sent_at REAL,
+                    sid TEXT,
+                    last_error TEXT,
+                    lease_until REAL
+                )
+            """)
+            columns = {row[1] for row in self.conn.execute("PRAGMA table_info(messages)")}
+            if "lease_until" not in columns:
+                self.conn.execute("ALTER TABLE messages ADD COLUMN lease_until REAL")
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS messages_due ON messages (status, next_attempt_at)"
+            )
+
+    def enqueue_many(self, messages):
+        now = time.time()
+        with self._lock, self.conn:
+            ids = []
+            for from_, to, body in messages:
+                cursor = self.conn.execute(
+                    "INSERT INTO messages (to_number, from_number, body, next_attempt_at, created_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (to, from_, body, now, now)
+                )
+                ids.append(cursor.lastrowid)
+            return ids
+
+    # Claims one due message (or one whose lease expired) in a single
+    # UPDATE ... RETURNING, so two processes can never claim the same row
+    def claim_due(self):
+        now = time.time()
+        with self._lock, self.conn:
+            return self.conn.execute(
+                "UPDATE messages SET status = 'sending', lease_until = ? WHERE id = ("
+                "  SELECT id FROM messages "
+                "  WHERE (status = 'pending' AND next_attempt_at <= ?) "
+                "     OR (status = 'sending' AND lease_until <= ?) "
+                "  ORDER BY next_attempt_at, id LIMIT 1"
+                ") RETURNING id, from_number, to_number, body, attempts, created_at",
+                (now + self.lease_seconds, now, now)
+            ).fetchone()
+
+    def next_due_in(self):
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT MIN(CASE WHEN status = 'pending' THEN next_attempt_at ELSE lease_until END) "
+                "FROM messages WHERE status IN ('pending', 'sending')"
+            ).fetchone()
+        return None if row[0] is None else max(0.0, row[0] - time.time())
+
+    def mark_sent(self, message_id, sid):
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE messages SET status = 'sent', sid = ?, sent_at = ?, attempts = attempts + 1, "
+                "lease_until = NULL WHERE id = ?",
+                (sid, time.time(), message_id)
+            )
+
+    def mark_retry(self, message_id, delay, error):
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE messages SET status = 'pending', attempts = attempts + 1, "
+                "next_attempt_at = ?, last_error = ?, lease_until = NULL WHERE id = ?",
+                (time.time() + delay, error, message_id)
+            )
+
+    def mark_failed(self, message_id, error):
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE messages SET status = 'failed', attempts = attempts + 1, last_error = ?, "
+                "lease_until = NULL WHERE id = ?",
+                (error, message_id)
+            )
+
+    # Status counts for the whole outbox, or only for the given message ids
+    def status_counts(self, ids=None):
+        with self._lock:
+            if ids is None:
+                return dict(self.conn.execute("SELECT status, COUNT(*) FROM messages GROUP BY status"))
+            ids = list(ids)
+            counts = {}
+            # Chunked to stay under SQLite's bound-parameter limit
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                rows = self.conn.execute(
+                    f"SELECT status, COUNT(*) FROM messages WHERE id IN ({','.join('?' * len(chunk))}) "
+                    "GROUP BY status",
+                    chunk
+                )
+                for status, n in rows:
+                    counts[status] = counts.get(status, 0) + n
+            return counts
+
+    def close(self):
+        self.conn.close()
+
+
+def percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+# =============================
+# DELIVERY QUEUE
+# Background workers drain the outbox: token-bucket rate limiting,
+# exponential backoff with jitter on retryable errors, and counters for
+# throughput / latency.
+# =============================
+class DeliveryQueue:
+
+    def __init__(self, sender, outbox, workers=2, rate=1.0, burst=5,
+                 max_attempts=5, backoff_base=1.0, backoff_max=60.0):
+        self.sender = sender
+        self.outbox = outbox
+        self.workers = workers
+        self.bucket = TokenBucket(rate, burst)
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._wakeup = threading.Condition()
+        self._stopping = False
+        self._threads = []
+        self._metrics_lock = threading.Lock()
+        self.sent = 0
+        self.failed = 0
+        self.retries = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.api_latencies = deque(maxlen=LATENCY_WINDOW)
+        self.started_at = None
+
+    def start(self):
+        if self._threads:
+            return self
+        self.started_at = time.monotonic()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"whatsapp-delivery-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self, timeout=None):
+        with self._wakeup:
+            self._stopping = True
+            self._wakeup.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def enqueue(self, from_, to, body):
+        return self.enqueue_many([(from_, to, body)])[0]
+
+    def enqueue_many(self, messages):
+        ids = self.outbox.enqueue_many(messages)
+        with self._wakeup:
+            self._wakeup.notify_all()
+        return ids
+
+    def backoff(self, attempt):
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return delay * (0.5 + random.random() / 2)
+
+    def _sleep(self, seconds):
+        with self._wakeup:
+            if not self._stopping:
+                self._wakeup.wait(seconds)
+
+    # Unexpected errors (a bug, a broken outbox file) are logged and the
+    # loop keeps going: a dead worker would leave claimed rows in 'sending'
+    # while the page still reports them as queued
+    def _run(self):
+        while True:
+            with self._wakeup:
+                if self._stopping:
+                    return
+            try:
+                message = self.outbox.claim_due()
+                if message is None:
+                    wait = self.outbox.next_due_in()
+                    self._sleep(0.5 if wait is None else min(wait, 0.5))
+                    continue
+            except Exception:
+                logger.exception("WhatsApp outbox claim failed")
+                self._sleep(1.0)
+                continue
+
+            try:
+                self._deliver(*message)
+            except Exception as e:
+                logger.exception("WhatsApp delivery of message %s failed", message[0])
+                try:
+                    self._retry_or_fail(message[0], message[4], f"{type(e).__name__}: {e}")
+                except Exception:
+                    # Lease expiry hands the row to a worker later
+                    logger.exception("Could not reschedule message %s", message[0])
+
+    def _retry_or_fail(self, message_id, attempts, error, retry_after=None):
+        attempt = attempts + 1
+        if attempt >= self.max_attempts:
+            self.outbox.mark_failed(message_id, error)
+            self._count(failed=1)
+        else:
+            delay = retry_after if retry_after is not None else self.backoff(attempt)
+            self.outbox.mark_retry(message_id, delay, error)
+            self._count(retries=1)
+
+    def _deliver(self, message_id, from_, to, body, attempts, created_at):
+        self.bucket.acquire()
+        start = time.monotonic()
+        try:
+            with span("whatsapp.send"):
+                sid = self.sender.send(from_, to, body)
+        except RetryableError as e:
+            self._retry_or_fail(message_id, attempts, str(e), e.retry_after)
+            return
+        except PermanentError as e:
+            self.outbox.mark_failed(message_id, str(e))
+            self._count(failed=1)
+            return
+
+        self.outbox.mark_sent(message_id, sid)
+        with self._metrics_lock:
+            self.sent += 1
+            self.api_latencies.append(time.monotonic() - start)
+            self.latencies.append(time.time() - created_at)
+
+    def _count(self, failed=0, retries=0):
+        with self._metrics_lock:
+            self.failed += failed
+            self.retries += retries
+
+    def metrics(self):
+        with self._metrics_lock:
+            elapsed = time.monotonic() - self.started_at if self.started_at else 0
+            return {
+                "sent": self.sent,
+                "failed": self.failed,
+                "retries": self.retries,
+                "throughput_per_s": self.sent / elapsed if elapsed else 0.0,
+                "latency_p50_s": percentile(self.latencies, 50),
+                "latency_p95_s": percentile(self.latencies, 95),
+                "api_latency_p50_s": percentile(self.api_latencies, 50),
+                "api_latency_p95_s": percentile(self.api_latencies, 95),
+            }
@@ -0,0 +1,41 @@
+import numpy as np
+from utils.tracing import traced
+
+
+# Sorted interval index over the (exp_min, exp_max) experience ranges.
+# Rows are kept twice, once ordered by exp_min and once by exp_max. A job
+# overlaps [low, high] when exp_min <= high and exp_max >= low; every row
+# with exp_max < low also has exp_min <= high, so the overlap count is
+# #(exp_min <= high) - #(exp_max < low): two binary searches, no strings.
+class ExperienceIndex:
+
+    def __init__(self, df):
+        self.n_rows = len(df)
+        exp_min = df["exp_min"].to_numpy(dtype="float64", na_value=np.nan)
+        exp_max = df["exp_max"].to_numpy(dtype="float64", na_value=np.nan)
+        rows = np.flatnonzero(~np.isnan(exp_min) & ~np.isnan(exp_max))
+
+        self.rows_by_min = rows[np.argsort(exp_min[rows], kind="stable")]
+        self.rows_by_max = rows[np.argsort(exp_max[rows], kind="stable")]
+        self.sorted_min = exp_min[self.rows_by_min]
+        self.sorted_max = exp_max[self.rows_by_max]
+
+    def _bounds(self, low, high):
+        started = int(np.searchsorted(self.sorted_min, high, side="right"))
+        ended = int(np.searchsorted(self.sorted_max, low, side="left"))
+        return started, ended
+
+    # Jobs whose range overlaps [low, high] years; high defaults to low,
+    # i.e. "jobs open to someone with `low` years"
+    def count(self, low, high=None):
+        started, ended = self._bounds(low, low if high is None else high)
+        return started - ended
+
+    # Same rows as a packed bitmap, so they AND with FilterIndex selections
+    @traced("experience_index.select")
+    def select(self, low, high=None):
+        started, ended = self._bounds(low, low if high is None else high)
+        mask = np.zeros(self.n_rows, dtype=bool)
+        mask[self.rows_by_min[:started]] = True
+        mask[self.rows_by_max[:ended]] = False
+        return np.packbits(mask)
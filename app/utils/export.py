@@ -0,0 +1,114 @@
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from utils.data_loader import CACHE_DIR
+from utils.tracing import traced
+
+EXPORT_DIR = os.path.join(CACHE_DIR, "exports")
+
+EXPORT_FORMATS = {
+    "csv": {"label": "CSV", "mime": "text/csv"},
+    "csv.gz": {"label": "CSV (gzip)", "mime": "application/gzip"},
+    "parquet": {"label": "Parquet", "mime": "application/vnd.apache.parquet"},
+}
+
+CHUNK_ROWS = 50_000
+MAX_EXPORTS = 50
+
+
+# Same dataset version + filters + columns + format -> same artifact
+def export_key(version, filters, columns, fmt):
+    spec = {
+        "version": version,
+        "filters": {col: sorted(map(str, values)) for col, values in sorted(filters.items()) if values},
+        "columns": list(columns),
+        "format": fmt,
+    }
+    return hashlib.sha1(json.dumps(spec, sort_keys=True).encode()).hexdigest()[:20]
+
+
+def export_path(key, fmt):
+    return os.path.join(EXPORT_DIR, f"export_{key}.{fmt}")
+
+
+def _write_csv(df, f):
+    for start in range(0, max(len(df), 1), CHUNK_ROWS):
+        df.iloc[start:start + CHUNK_ROWS].to_csv(f, header=start == 0, index=False)
+
+
+def _write_parquet(df, path):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.Schema.from_pandas(df.iloc[:0], preserve_index=False)
+    with pq.ParquetWriter(path, schema) as writer:
+        for start in range(0, len(df), CHUNK_ROWS):
+            chunk = df.iloc[start:start + CHUNK_ROWS]
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+# Serializes the frame chunk by chunk, so no full-size string or buffer
+# is ever held in memory. Each call writes its own uniquely named temp file,
+# so sessions exporting the same key at once never share a partial file.
+@traced("write_export")
+def write_export(df, path, fmt):
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=EXPORT_DIR, prefix="export_", suffix=".tmp",
+                                     delete=False) as tmp:
+        tmp_path = tmp.name
+
+    try:
+        if fmt == "csv.gz":
+            with gzip.open(tmp_path, "wt", newline="", encoding="utf-8") as f:
+                _write_csv(df, f)
+        elif fmt == "csv":
+            with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+                _write_csv(df, f)
+        else:
+            _write_parquet(df, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    prune_exports()
+
+
+# Keeps the most recently used artifacts only
+def prune_exports():
+    files = [os.path.join(EXPORT_DIR, name) for name in os.listdir(EXPORT_DIR)
+             if name.startswith("export_") and not name.endswith(".tmp")]
+    mtimes = {}
+    for path in files:
+        try:
+            mtimes[path] = os.path.getmtime(path)
+        except FileNotFoundError:
+            pass
+    # Another session may be pruning too
+    for path in sorted(mtimes, key=mtimes.get, reverse=True)[MAX_EXPORTS:]:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+# Path of a ready artifact, or None if it has not been generated yet
+def cached_export(key, fmt):
+    path = export_path(key, fmt)
+    if not os.path.exists(path):
+        return None
+    os.utime(path)
+    return path
+
+
+# build_frame is only called on a cache miss
+def get_export(key, fmt, build_frame):
+    path = cached_export(key, fmt)
+    if path is None:
+        path = export_path(key, fmt)
+        write_export(build_frame(), path, fmt)
+    return path
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+from utils.tracing import traced
+
+FILTER_COLUMNS = ["job_group", "clean_location", "experience"]
+
+# Set bits per byte, used to popcount packed bitmaps
+POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def popcount(bits):
+    return int(POPCOUNT[bits].sum(dtype=np.int64))
+
+
+# One packed bitmap (np.packbits, 1 bit per row) per distinct value of each
+# filter column. Multiselect filters OR bitmaps within a column and AND
+# across columns, so counts never need a filtered DataFrame.
+class FilterIndex:
+
+    def __init__(self, df, columns=FILTER_COLUMNS):
+        self.n_rows = len(df)
+        self.n_bytes = (self.n_rows + 7) // 8
+        self.bitmaps = {}
+
+        for column in columns:
+            codes, uniques = pd.factorize(df[column], sort=True)
+            self.bitmaps[column] = {
+                value: np.packbits(codes == code)
+                for code, value in enumerate(uniques)
+            }
+
+    def values(self, column):
+        return list(self.bitmaps[column])
+
+    def all_rows(self):
+        return np.packbits(np.ones(self.n_rows, dtype=bool))
+
+    @traced("filter_index.select")
+    def select(self, **filters):
+        bits = None
+        for column, selected in filters.items():
+            if not selected:
+                continue
+
+            column_bits = np.zeros(self.n_bytes, dtype=np.uint8)
+            for value in selected:
+                value_bits = self.bitmaps[column].get(value)
+                if value_bits is not None:
+                    column_bits |= value_bits
+
+            bits = column_bits if bits is None else bits & column_bits
+
+        return self.all_rows() if bits is None else bits
+
+    def count(self, bits):
+        return popcount(bits)
+
+    def nunique(self, column, bits):
+        return sum(
+            1 for value_bits in self.bitmaps[column].values()
+            if (value_bits & bits).any()
+        )
+
+    def mask(self, bits):
+        return np.unpackbits(bits, count=self.n_rows).astype(bool)
+
+    def rows(self, bits):
+        return np.flatnonzero(np.unpackbits(bits, count=self.n_rows))
+
+    def take(self, df, bits):
+        if self.count(bits) == self.n_rows:
+            return df
+        return df.iloc[self.rows(bits)]
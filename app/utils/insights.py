@@ -0,0 +1,139 @@
+import threading
+from collections import OrderedDict
+from utils.tracing import traced
+
+FILTER_COLUMNS = ["job_group", "clean_location"]
+
+
+# Order- and duplicate-insensitive, hashable form of a filter spec:
+# {"job_group": ["B", "A", "A"]} -> (("clean_location", ()), ("job_group", ("A", "B")))
+def normalize_filters(filters):
+    return tuple(
+        (column, tuple(sorted(set(filters.get(column) or []))))
+        for column in sorted(FILTER_COLUMNS)
+    )
+
+
+def render_message(insight):
+    role_text = "\n".join(
+        [f"{i+1}. {role} – {count} jobs"
+         for i, (role, count) in enumerate(insight["top_roles"])]
+    )
+
+    city_text = "\n".join(
+        [f"{i+1}. {city} – {count} openings"
+         for i, (city, count) in enumerate(insight["top_cities"])]
+    )
+
+    top_role = insight["top_roles"][0][0]
+    top_city = insight["top_cities"][0][0]
+    top_exp = insight["top_experience"]
+
+    # Rows without a readable experience range have no bucket, so a filter
+    # can match jobs and still have no sweet spot
+    exp_text = ""
+    exp_tip = ""
+    if top_exp is not None:
+        exp_text = f"""
+🎯 Experience Sweet Spot:
+{top_exp} years ({insight["top_experience_pct"]}% of roles)
+"""
+        exp_tip = f"\nif you fall in the {top_exp} experience range."
+
+    return f"""
+📊 CareerIQ – Market Intelligence
+
+🔹 Total Jobs Analyzed: {insight["total_jobs"]}
+
+🔥 Top Hiring Roles:
+{role_text}
+
+🌍 Top Hiring Cities:
+{city_text}
+{exp_text}
+💡 Action Tip:
+Target {top_role} roles in {top_city}{exp_tip}
+
+Stay skilled. Stay relevant.
+"""
+
+
+# Structured insight for a normalized filter spec, answered from the count
+# cube. "message" is None when no job matches.
+def build_insight(cube, normalized_filters):
+    filters = {column: list(values) for column, values in normalized_filters}
+    total = cube.total(**filters)
+
+    insight = {
+        "filters": filters,
+        "total_jobs": total,
+        "top_roles": [],
+        "top_cities": [],
+        "top_experience": None,
+        "top_experience_pct": None,
+        "message": None,
+    }
+    if total == 0:
+        return insight
+
+    top_roles = cube.counts_by("job_group", **filters).head(2)
+    top_cities = cube.counts_by("clean_location", **filters).head(2)
+
+    exp_counts = cube.counts_by("experience", **filters)
+
+    insight.update({
+        "top_roles": [(role, int(count)) for role, count in top_roles.items()],
+        "top_cities": [(city, int(count)) for city, count in top_cities.items()],
+    })
+    if not exp_counts.empty:
+        exp_dist = exp_counts / exp_counts.sum() * 100
+        insight.update({
+            "top_experience": exp_dist.idxmax(),
+            "top_experience_pct": round(exp_dist.max()),
+        })
+    if insight["top_cities"]:
+        insight["message"] = render_message(insight)
+    return insight
+
+
+# Bounded LRU shared by every session in the process, keyed on
+# (dataset version, normalized filters)
+class InsightCache:
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, compute):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        value = compute()
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "size": len(self._entries), "maxsize": self.maxsize}
+
+
+INSIGHT_CACHE = InsightCache()
+
+
+@traced("get_insight")
+def get_insight(cube, version, filters, cache=INSIGHT_CACHE):
+    normalized = normalize_filters(filters)
+    return cache.get((version, normalized), lambda: build_insight(cube, normalized))
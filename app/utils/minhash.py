@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+
+# Smallest prime above 2**32: with 32-bit inputs and coefficients,
+# a * x + b stays below 2**64, so the universal hash needs no big ints
+HASH_PRIME = np.uint64(4294967311)
+MAX_HASH = np.uint64(0xFFFFFFFF)
+EMPTY_SIGNATURE = np.uint32(0xFFFFFFFF)
+
+# Tokens hashed per block while computing signatures (bounds the
+# num_perm x tokens intermediate)
+BLOCK_TOKENS = 50_000
+
+
+# Stable 32-bit hashes of string tokens (same value in every process,
+# unlike hash())
+def token_hashes(tokens):
+    hashes = pd.util.hash_array(np.asarray(tokens, dtype=object))
+    return (hashes & MAX_HASH).astype(np.uint64)
+
+
+# MinHash signatures for many sets at once. Sets are given CSR-style:
+# token hashes of set i are hashes[indptr[i]:indptr[i + 1]].
+class MinHasher:
+
+    def __init__(self, num_perm=128, seed=1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.seed = seed
+        self.a = rng.integers(1, int(MAX_HASH), size=num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, int(MAX_HASH), size=num_perm, dtype=np.uint64)
+
+    def signatures(self, indptr, hashes):
+        indptr = np.asarray(indptr, dtype=np.int64)
+        n_sets = len(indptr) - 1
+        out = np.full((n_sets, self.num_perm), EMPTY_SIGNATURE, dtype=np.uint32)
+
+        # Whole sets per block, so every set is reduced in one piece
+        start = 0
+        while start < n_sets:
+            stop = int(np.searchsorted(indptr, indptr[start] + BLOCK_TOKENS, side="right")) - 1
+            stop = min(max(stop, start + 1), n_sets)
+
+            lo, hi = indptr[start], indptr[stop]
+            if hi > lo:
+                block = hashes[lo:hi]
+                permuted = (np.outer(block, self.a) + self.b) % HASH_PRIME
+                permuted = (permuted & MAX_HASH).astype(np.uint32)
+
+                offsets = indptr[start:stop] - lo
+                sizes = np.diff(indptr[start:stop + 1])
+                non_empty = sizes > 0
+                # reduceat on an empty segment returns the next row, so
+                # only reduce the non-empty ones
+                mins = np.minimum.reduceat(permuted, offsets[non_empty], axis=0)
+                out[start:stop][non_empty] = mins
+            start = stop
+        return out
+
+
+# Estimated Jaccard similarity of one signature against many
+def estimate_jaccard(signature, signatures):
+    return (signatures == signature).mean(axis=1)
+
+
+# One 64-bit key per (set, band), combining the band's rows of the signature
+def band_keys(signatures, bands):
+    rows = signatures.shape[1] // bands
+    keys = np.zeros((signatures.shape[0], bands), dtype=np.uint64)
+    multiplier = np.uint64(1099511628211)
+    with np.errstate(over="ignore"):
+        for j in range(rows):
+            column = signatures[:, j::rows][:, :bands].astype(np.uint64)
+            keys = keys * multiplier + column
+    return keys
+
+
+# Probability that a pair with Jaccard similarity s shares at least one
+# band bucket, for b bands of r rows
+def candidate_probability(s, bands, rows):
+    return 1 - (1 - s ** rows) ** bands
@@ -0,0 +1,95 @@
+import re
+import numpy as np
+import pandas as pd
+
+# =============================
+# RULE TABLES
+# Ordered: the first rule with a keyword found in the
+# lowercased value wins.
+# =============================
+LOCATION_RULES = [
+    ("Pune", ["pune"]),
+    ("Bengaluru", ["bangalore", "bengaluru"]),
+    ("Mumbai", ["mumbai"]),
+    ("Hyderabad", ["hyderabad"]),
+    ("Chennai", ["chennai"]),
+    ("Delhi NCR", ["delhi", "ncr", "gurgaon"]),
+]
+
+ROLE_RULES = [
+    ("Data Scientist", ["data scientist"]),
+    ("Data Analyst", ["data analyst"]),
+    ("ML Engineer", ["machine learning", "ml engineer"]),
+    ("AI Engineer", ["ai engineer"]),
+    ("Data Engineer", ["data engineer"]),
+    ("Cloud Engineer", ["cloud"]),
+    ("Business Analyst", ["business analyst"]),
+    ("Software Engineer", ["software", "developer"]),
+]
+
+DEFAULT_ROLE = "Other Roles"
+
+
+def compile_rules(rules):
+    return [
+        (label, re.compile("|".join(re.escape(k) for k in keywords)))
+        for label, keywords in rules
+    ]
+
+
+LOCATION_PATTERNS = compile_rules(LOCATION_RULES)
+ROLE_PATTERNS = compile_rules(ROLE_RULES)
+
+
+def match_value(value, patterns):
+    for label, pattern in patterns:
+        if pattern.search(value):
+            return label
+    return None
+
+
+# Returns (labels, unmatched mask) for a Series of lowercased strings
+def match_rules(lowered, patterns):
+    labels = np.full(len(lowered), None, dtype=object)
+    unmatched = np.ones(len(lowered), dtype=bool)
+
+    for label, pattern in patterns:
+        hits = unmatched & lowered.str.contains(pattern).to_numpy(dtype=bool)
+        labels[hits] = label
+        unmatched &= ~hits
+
+    return labels, unmatched
+
+
+# Evaluates map_uniques once per distinct value and broadcasts the result
+# back to every row through the factorize codes
+def map_unique(series, map_uniques, na_value):
+    codes, uniques = pd.factorize(series)
+    mapped = map_uniques(pd.Series(uniques, dtype=object))
+
+    # code -1 (missing) picks up the trailing na_value
+    lookup = np.append(np.asarray(mapped, dtype=object), np.array([na_value], dtype=object))
+    return pd.Series(lookup[codes], index=series.index, dtype=object)
+
+
+def _locations_from_uniques(uniques):
+    lowered = uniques.str.lower()
+    labels, unmatched = match_rules(lowered, LOCATION_PATTERNS)
+    labels[unmatched] = lowered[unmatched].str.title().to_numpy(dtype=object)
+    return labels
+
+
+def _roles_from_uniques(uniques):
+    lowered = uniques.astype(str).str.lower()
+    labels, unmatched = match_rules(lowered, ROLE_PATTERNS)
+    labels[unmatched] = DEFAULT_ROLE
+    return labels
+
+
+def normalize_locations(series):
+    return map_unique(series, _locations_from_uniques, None)
+
+
+def normalize_job_groups(series):
+    # Missing titles stringify to "nan" in map_job_group, which is "Other Roles"
+    return map_unique(series, _roles_from_uniques, DEFAULT_ROLE)
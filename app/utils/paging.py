@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+from utils.tracing import traced
+
+
+# Offset/limit pages over the job table with optional sort key and column
+# projection. Sort orders are computed once per column and reused, so a
+# page only gathers the rows and columns it actually returns.
+class JobTableQuery:
+
+    def __init__(self, df):
+        self.df = df
+        self.n_rows = len(df)
+        self._orders = {}
+        self._ranks = {}
+
+    # Row positions sorted by `column` in either direction; nulls last and
+    # ties in row order both ways, so descending is not ascending reversed
+    def sort_order(self, column, ascending=True):
+        order = self._orders.get((column, ascending))
+        if order is None:
+            values = self.df[column].reset_index(drop=True)
+            order = values.sort_values(
+                ascending=ascending, kind="stable", na_position="last"
+            ).index.to_numpy()
+            self._orders[(column, ascending)] = order
+        return order
+
+    # Inverse of sort_order: position of each row within the sorted order
+    def sort_rank(self, column, ascending=True):
+        rank = self._ranks.get((column, ascending))
+        if rank is None:
+            order = self.sort_order(column, ascending)
+            rank = np.empty_like(order)
+            rank[order] = np.arange(len(order))
+            self._ranks[(column, ascending)] = rank
+        return rank
+
+    def _page_rows(self, rows, sort_by, ascending, offset, limit):
+        stop = offset + limit
+
+        if sort_by is None:
+            if rows is None:
+                return np.arange(offset, min(stop, self.n_rows))
+            return rows[offset:stop]
+
+        if rows is None:
+            return self.sort_order(sort_by, ascending)[offset:stop]
+
+        # Filtered + sorted: rank the selected rows, then only fully sort the
+        # ones that can land on this page
+        keys = self.sort_rank(sort_by, ascending)[rows]
+        if stop < len(keys):
+            candidates = np.argpartition(keys, stop - 1)[:stop]
+        else:
+            candidates = np.arange(len(keys))
+        candidates = candidates[np.argsort(keys[candidates], kind="stable")]
+        return rows[candidates[offset:stop]]
+
+    # rows: sorted row positions of the current filter (None = all rows).
+    # Returns (page frame, total matching rows).
+    @traced("job_query.page")
+    def page(self, rows=None, sort_by=None, ascending=True, offset=0, limit=100, columns=None):
+        total = self.n_rows if rows is None else len(rows)
+        offset = max(0, min(offset, total))
+        page_rows = self._page_rows(rows, sort_by, ascending, offset, max(0, limit))
+
+        columns = list(columns) if columns else list(self.df.columns)
+        page_df = pd.DataFrame(
+            {col: self.df[col].take(page_rows).to_numpy() for col in columns},
+            index=page_rows
+        )
+        return page_df, total
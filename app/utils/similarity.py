@@ -0,0 +1,105 @@
+import re
+import numpy as np
+import pandas as pd
+from utils.minhash import MinHasher, band_keys, estimate_jaccard, token_hashes
+from utils.skill_matrix import skill_key, split_skills
+from utils.tracing import traced
+
+NUM_PERM = 128
+BANDS = 32
+# A band bucket shared by more jobs than this (reposted duplicates) only
+# contributes its first entries as candidates
+MAX_BUCKET = 200
+NO_BUCKET = np.uint64(np.iinfo(np.uint64).max)
+
+TITLE_WORDS = re.compile(r"[a-z0-9+#]+")
+
+
+# Feature set of every job, CSR-style: normalized skill keys ("s:python")
+# plus title word unigrams and bigrams ("t:data", "t:data scientist").
+# Returns (indptr, token array).
+def job_features(df):
+    skills = split_skills(df["skills_extracted"].reset_index(drop=True).astype(object))
+    skills = "s:" + skills.map(skill_key)
+    skills = skills[skills != "s:"]
+
+    titles = df["job_title"].reset_index(drop=True).astype(object).fillna("")
+    words = titles.str.lower().str.findall(TITLE_WORDS)
+    bigrams = words.map(lambda w: [f"{a} {b}" for a, b in zip(w, w[1:])])
+    title = "t:" + pd.concat([words.explode(), bigrams.explode()]).dropna()
+
+    tokens = pd.concat([skills, title])
+    frame = pd.DataFrame({"row": tokens.index.to_numpy(), "token": tokens.to_numpy()})
+    frame = frame.drop_duplicates().sort_values("row", kind="stable")
+
+    counts = np.bincount(frame["row"].to_numpy(), minlength=len(df))
+    indptr = np.concatenate([[0], np.cumsum(counts)])
+    return indptr, frame["token"].to_numpy(dtype=object)
+
+
+# MinHash LSH index for "jobs like this one". Each band's keys are kept
+# sorted next to their row ids, so a bucket lookup is two searchsorted
+# calls and the whole index persists as plain arrays.
+class SimilarJobsIndex:
+
+    def __init__(self, signatures, sorted_keys, sorted_rows, seed=1):
+        self.signatures = signatures
+        self.sorted_keys = sorted_keys
+        self.sorted_rows = sorted_rows
+        self.seed = seed
+        self.bands = sorted_keys.shape[0]
+
+    @classmethod
+    def from_frame(cls, df, num_perm=NUM_PERM, bands=BANDS, seed=1):
+        indptr, tokens = job_features(df)
+        signatures = MinHasher(num_perm, seed).signatures(indptr, token_hashes(tokens))
+
+        # Jobs without any feature share the "empty" signature; a reserved
+        # key keeps them out of the buckets so they never match each other
+        keys = band_keys(signatures, bands).T
+        keys[:, indptr[1:] == indptr[:-1]] = NO_BUCKET
+
+        order = np.argsort(keys, axis=1, kind="stable")
+        sorted_keys = np.take_along_axis(keys, order, axis=1)
+        return cls(signatures, sorted_keys, order.astype(np.int32), seed)
+
+    def save(self, path):
+        np.savez(path, signatures=self.signatures, sorted_keys=self.sorted_keys,
+                 sorted_rows=self.sorted_rows, seed=self.seed)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data["signatures"], data["sorted_keys"], data["sorted_rows"],
+                       int(data["seed"]))
+
+    # Rows sharing at least one of the first `bands` band buckets with `row`.
+    # Fewer bands: fewer candidates, faster, lower recall.
+    def candidates(self, row, bands=None):
+        bands = self.bands if bands is None else min(bands, self.bands)
+        keys = band_keys(self.signatures[row:row + 1], self.bands)[0]
+
+        found = []
+        for band in range(bands):
+            band_sorted = self.sorted_keys[band]
+            lo = np.searchsorted(band_sorted, keys[band], side="left")
+            hi = np.searchsorted(band_sorted, keys[band], side="right")
+            if hi > lo and keys[band] != NO_BUCKET:
+                found.append(self.sorted_rows[band, lo:min(hi, lo + MAX_BUCKET)])
+        if not found:
+            return np.empty(0, dtype=np.int32)
+
+        rows = np.unique(np.concatenate(found))
+        return rows[rows != row]
+
+    # Up to k most similar rows to `row` as (rows, estimated Jaccard),
+    # best first, dropping candidates below min_similarity
+    @traced("similar_jobs")
+    def similar(self, row, k=10, bands=None, min_similarity=0.0):
+        rows = self.candidates(row, bands)
+        scores = estimate_jaccard(self.signatures[row], self.signatures[rows])
+
+        keep = scores >= min_similarity
+        rows, scores = rows[keep], scores[keep]
+        order = np.argsort(-scores, kind="stable")[:k]
+        return rows[order], scores[order]
@@ -0,0 +1,200 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+from utils.skill_matrix import skill_key
+from utils.tracing import traced
+
+# Bump whenever the ranking or clustering changes, so persisted graphs are
+# rebuilt
+GRAPH_VERSION = 2
+
+ALL_JOBS = "All Roles"
+
+# Related skills kept per skill and scope
+TOP_K = 20
+# A related skill must appear in at least this many postings with the
+# skill, and in at least MIN_SHARE of the skill's postings, so rare skills
+# that happen to always co-occur cannot top the list
+MIN_COOCCURRENCE = 3
+MIN_SHARE = 0.02
+# Cluster edges: mutual top-N neighbours with at least this lift and support
+CLUSTER_NEIGHBOURS = 5
+CLUSTER_MIN_LIFT = 2.0
+CLUSTER_MIN_COOCCURRENCE = 5
+
+
+# Top-k related skills of every skill within one set of postings, from the
+# sparse skill x skill co-occurrence matrix X.T @ X. Related skills are
+# positively associated pairs (lift > 1) ranked by confidence P(b | a),
+# then lift. Nothing dense in the vocabulary size is allocated beyond the
+# (skills x k) result. Returns (counts, neighbours, co-occurrence, lift);
+# missing slots are -1 / 0.
+def related_skills(incidence, k=TOP_K, min_cooccurrence=MIN_COOCCURRENCE, min_share=MIN_SHARE):
+    n_jobs, n_skills = incidence.shape
+    cooccurrence = (incidence.T @ incidence).tocoo()
+    counts = np.asarray(incidence.sum(axis=0)).ravel()
+
+    rows, cols = cooccurrence.row, cooccurrence.col
+    together = cooccurrence.data.astype(np.int64)
+    min_together = np.maximum(min_cooccurrence, np.ceil(min_share * counts[rows]))
+    # lift = P(a, b) / (P(a) P(b))
+    lift = together * n_jobs / (counts[rows].astype(np.float64) * counts[cols])
+
+    keep = (rows != cols) & (together >= min_together) & (lift > 1)
+    rows, cols, together, lift = rows[keep], cols[keep], together[keep], lift[keep]
+
+    # Best first within each row; P(b | a) = together / count(a), and count(a)
+    # is fixed within a row, so ranking by support is ranking by confidence
+    order = np.lexsort((-lift, -together, rows))
+    rows, cols, together, lift = rows[order], cols[order], together[order], lift[order]
+    row_start = np.searchsorted(rows, np.arange(n_skills))
+    rank = np.arange(len(rows)) - row_start[rows]
+    top = rank < k
+
+    neighbours = np.full((n_skills, k), -1, dtype=np.int32)
+    neighbour_counts = np.zeros((n_skills, k), dtype=np.int32)
+    neighbour_lift = np.zeros((n_skills, k), dtype=np.float32)
+    neighbours[rows[top], rank[top]] = cols[top]
+    neighbour_counts[rows[top], rank[top]] = together[top]
+    neighbour_lift[rows[top], rank[top]] = lift[top]
+    return counts.astype(np.int32), neighbours, neighbour_counts, neighbour_lift
+
+
+# Cluster id per skill (-1 when not in a cluster of 2+): connected
+# components over strong, mutual top-N links
+def skill_clusters(neighbours, neighbour_counts, neighbour_lift):
+    n_skills = neighbours.shape[0]
+    top = neighbours[:, :CLUSTER_NEIGHBOURS]
+    strong = (top >= 0) \
+        & (neighbour_lift[:, :CLUSTER_NEIGHBOURS] >= CLUSTER_MIN_LIFT) \
+        & (neighbour_counts[:, :CLUSTER_NEIGHBOURS] >= CLUSTER_MIN_COOCCURRENCE)
+
+    sources = np.repeat(np.arange(n_skills), CLUSTER_NEIGHBOURS)[strong.ravel()]
+    targets = top[strong]
+    graph = sparse.csr_matrix(
+        (np.ones(len(sources), dtype=np.int8), (sources, targets)), shape=(n_skills, n_skills)
+    )
+    # Mutual links only, so one hub skill does not merge everything
+    graph = graph.multiply(graph.T)
+
+    _, labels = connected_components(graph, directed=False)
+    sizes = np.bincount(labels)
+    return np.where(sizes[labels] > 1, labels, -1).astype(np.int32)
+
+
+# Skill co-occurrence over all postings and per job_group. Related skills
+# and clusters are precomputed per scope, so queries are array lookups.
+class SkillGraph:
+
+    def __init__(self, vocabulary, scopes, counts, neighbours, neighbour_counts,
+                 neighbour_lift, clusters, jobs):
+        self.vocabulary = np.asarray(vocabulary, dtype=object)
+        self.scopes = list(scopes)
+        self.counts = counts
+        self.neighbours = neighbours
+        self.neighbour_counts = neighbour_counts
+        self.neighbour_lift = neighbour_lift
+        self.clusters = clusters
+        self.jobs = jobs
+        self._scope_index = {scope: i for i, scope in enumerate(self.scopes)}
+        self._skill_index = {skill_key(skill): i for i, skill in enumerate(self.vocabulary)}
+
+        # Skills mentioned in each scope, most frequent first
+        self._skill_order = []
+        for s in range(len(self.scopes)):
+            order = np.argsort(-self.counts[s], kind="stable")
+            self._skill_order.append(self.vocabulary[order[self.counts[s][order] > 0]].tolist())
+
+        # Skills grouped by cluster (most frequent first within a cluster),
+        # so a cluster's members are one contiguous slice
+        self._cluster_order = []
+        for s in range(len(self.scopes)):
+            order = np.lexsort((-self.counts[s], self.clusters[s]))
+            self._cluster_order.append((order, self.clusters[s][order]))
+
+    @classmethod
+    def from_matrix(cls, skill_matrix, job_groups):
+        job_groups = pd.Series(job_groups).reset_index(drop=True).astype(object)
+        groups = sorted(job_groups.dropna().unique())
+        scopes = [ALL_JOBS] + groups
+
+        per_scope = []
+        jobs = []
+        for scope in scopes:
+            incidence = skill_matrix.matrix
+            if scope != ALL_JOBS:
+                incidence = incidence[np.flatnonzero((job_groups == scope).to_numpy())]
+            related = related_skills(incidence)
+            per_scope.append(related + (skill_clusters(*related[1:]),))
+            jobs.append(incidence.shape[0])
+
+        stacked = [np.stack(arrays) for arrays in zip(*per_scope)]
+        return cls(skill_matrix.vocabulary, scopes, *stacked, np.array(jobs))
+
+    def save(self, path):
+        np.savez(
+            path,
+            vocabulary=np.array(self.vocabulary, dtype=str),
+            scopes=np.array(self.scopes, dtype=str),
+            counts=self.counts,
+            neighbours=self.neighbours,
+            neighbour_counts=self.neighbour_counts,
+            neighbour_lift=self.neighbour_lift,
+            clusters=self.clusters,
+            jobs=self.jobs,
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(
+                data["vocabulary"].tolist(), data["scopes"].tolist(), data["counts"],
+                data["neighbours"], data["neighbour_counts"], data["neighbour_lift"],
+                data["clusters"], data["jobs"],
+            )
+
+    def _scope(self, scope):
+        return self._scope_index.get(scope or ALL_JOBS)
+
+    def skill_index(self, skill):
+        return self._skill_index.get(skill_key(skill))
+
+    # Skills mentioned in the scope, most frequent first
+    def skills(self, scope=None):
+        s = self._scope(scope)
+        if s is None:
+            return []
+        return self._skill_order[s]
+
+    # Skills that go with `skill`: postings mentioning both, their share of
+    # the skill's postings (P(b | a)), lift and PMI
+    @traced("skill_graph.related")
+    def related(self, skill, k=10, scope=None):
+        s, i = self._scope(scope), self.skill_index(skill)
+        columns = ["skill", "jobs_together", "share", "lift", "pmi"]
+        if s is None or i is None:
+            return pd.DataFrame(columns=columns)
+
+        neighbours = self.neighbours[s, i, :k]
+        found = neighbours >= 0
+        together = self.neighbour_counts[s, i, :k][found]
+        lift = self.neighbour_lift[s, i, :k][found]
+        return pd.DataFrame({
+            "skill": self.vocabulary[neighbours[found]],
+            "jobs_together": together,
+            "share": together / self.counts[s, i],
+            "lift": lift,
+            "pmi": np.log2(lift),
+        })
+
+    # Other members of the skill's cluster, most frequent first
+    def cluster(self, skill, scope=None):
+        s, i = self._scope(scope), self.skill_index(skill)
+        if s is None or i is None or self.clusters[s, i] < 0:
+            return []
+        order, labels = self._cluster_order[s]
+        lo, hi = np.searchsorted(labels, self.clusters[s, i], side="left"), \
+            np.searchsorted(labels, self.clusters[s, i], side="right")
+        members = order[lo:hi]
+        return self.vocabulary[members[members != i]].tolist()
@@ -0,0 +1,116 @@
+import re
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from utils.tracing import traced
+
+# Known misspellings seen in the scraped feeds, keyed by normalized skill key
+SKILL_ALIASES = {
+    "biqquery": "bigquery",
+    "tensorflo": "tensorflow",
+    "pyhton": "python",
+    "machinelearing": "machinelearning",
+}
+
+SEPARATOR_SPACES = re.compile(r"\s*([/&+\-.])\s*")
+NON_KEY_CHARS = re.compile(r"[^a-z0-9+#]")
+
+
+# "Machine  learning" -> "machine learning", "CI / CD" -> "ci/cd"
+def normalize_skill(skill):
+    skill = " ".join(skill.lower().split())
+    return SEPARATOR_SPACES.sub(r"\1", skill)
+
+
+# Spelling variants share a key: "big query", "BigQuery", "BiqQuery" -> "bigquery"
+def skill_key(skill):
+    key = NON_KEY_CHARS.sub("", skill.lower())
+    return SKILL_ALIASES.get(key, key)
+
+
+def split_skills(series):
+    tokens = series.dropna().str.split(",").explode()
+    tokens = tokens.dropna().str.strip()
+    return tokens[tokens != ""]
+
+
+# Binary job x skill incidence matrix (CSR) over a merged skill vocabulary.
+# Each skill is labelled with its most frequent normalized spelling.
+class SkillMatrix:
+
+    def __init__(self, vocabulary, matrix):
+        self.vocabulary = np.asarray(vocabulary, dtype=object)
+        self.matrix = matrix
+
+    @classmethod
+    def from_frame(cls, df, column="skills_extracted"):
+        skills = df[column].reset_index(drop=True)
+        tokens = split_skills(skills.astype(object))
+
+        # Rules run once per distinct raw token, not per occurrence.
+        # Tokens with an empty key ("-", ".") carry no skill.
+        token_codes, raw_tokens = pd.factorize(tokens)
+        spellings = [normalize_skill(t) for t in raw_tokens]
+        keys = [skill_key(t) or None for t in raw_tokens]
+        key_codes, vocab_keys = pd.factorize(pd.Series(keys, dtype=object))
+
+        occurrences = np.bincount(token_codes, minlength=len(raw_tokens))
+        spelling_counts = pd.DataFrame({"key": key_codes, "spelling": spellings, "n": occurrences})
+        labels = (
+            spelling_counts[spelling_counts["key"] >= 0]
+            .groupby(["key", "spelling"], sort=False)["n"].sum()
+            .sort_values(ascending=False, kind="stable")
+            .reset_index()
+            .drop_duplicates("key")
+            .set_index("key")["spelling"]
+            .sort_index()
+        )
+
+        columns = key_codes[token_codes]
+        valid = columns >= 0
+        rows = tokens.index.to_numpy()[valid]
+        columns = columns[valid]
+
+        matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, columns)),
+            shape=(len(skills), len(vocab_keys)),
+        )
+        # A skill repeated within one posting counts once
+        matrix.data[:] = 1
+        return cls(labels.to_numpy(dtype=object), matrix)
+
+    def save(self, path):
+        np.savez(
+            path,
+            data=self.matrix.data,
+            indices=self.matrix.indices,
+            indptr=self.matrix.indptr,
+            shape=np.array(self.matrix.shape),
+            vocabulary=np.array(self.vocabulary, dtype=str),
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            matrix = sparse.csr_matrix(
+                (data["data"], data["indices"], data["indptr"]),
+                shape=tuple(data["shape"]),
+            )
+            return cls(data["vocabulary"].tolist(), matrix)
+
+    # Number of postings mentioning each skill, over rows where mask is True
+    def skill_counts(self, mask=None):
+        if mask is None:
+            return np.asarray(self.matrix.sum(axis=0)).ravel()
+        return self.matrix.T @ np.asarray(mask, dtype=np.int32)
+
+    @traced("skill_matrix.top_skills")
+    def top_skills(self, k, mask=None):
+        counts = self.skill_counts(mask)
+        k = min(k, np.count_nonzero(counts))
+        if k == 0:
+            return pd.Series(dtype=np.int64, name="count")
+
+        top = np.argpartition(-counts, k - 1)[:k]
+        top = top[np.lexsort((top, -counts[top]))]
+        return pd.Series(counts[top], index=self.vocabulary[top], name="count")
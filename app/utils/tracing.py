@@ -0,0 +1,242 @@
+import atexit
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+import numpy as np
+
+# Off unless CAREERIQ_TRACE is set. When off, span() hands back one shared
+# no-op object and traced() returns the function unchanged, so the
+# instrumented code paths cost a function call at most.
+ENABLED = os.environ.get("CAREERIQ_TRACE", "").lower() not in ("", "0", "false", "no")
+# Written on interpreter exit when set: Chrome trace for *.json, else JSON lines
+TRACE_FILE = os.environ.get("CAREERIQ_TRACE_FILE")
+
+MAX_RERUNS = int(os.environ.get("CAREERIQ_TRACE_RERUNS", 100))
+MAX_BACKGROUND_SPANS = 1000
+
+_lock = threading.Lock()
+_local = threading.local()
+_rerun_ids = itertools.count(1)
+_reruns = deque(maxlen=MAX_RERUNS)
+_background = deque(maxlen=MAX_BACKGROUND_SPANS)
+_counters = {}
+
+_T0_NS = time.perf_counter_ns()
+_T0_EPOCH = time.time()
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def rss_bytes():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        # Peak rather than current RSS, but still shows growth
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+# =============================
+# Recording
+# =============================
+class _NullSpan:
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("name", "attrs", "start_ns")
+
+    def __init__(self, name, attrs):
+        self.name = name
+        self.attrs = attrs
+
+    def __enter__(self):
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end_ns = time.perf_counter_ns()
+        record = {
+            "name": self.name,
+            "ts_us": (self.start_ns - _T0_NS) / 1000,
+            "dur_us": (end_ns - self.start_ns) / 1000,
+            "thread": threading.get_ident(),
+        }
+        if self.attrs:
+            record["args"] = self.attrs
+        if exc_type is not None:
+            record["error"] = exc_type.__name__
+
+        rerun = getattr(_local, "rerun", None)
+        if rerun is None:
+            _background.append(record)
+        else:
+            rerun["spans"].append(record)
+            rerun["end_ns"] = end_ns
+            rerun["rss_end"] = rss_bytes()
+        return False
+
+
+def span(name, **attrs):
+    if not ENABLED:
+        return _NULL_SPAN
+    return _Span(name, attrs)
+
+
+def traced(name):
+    def decorator(fn):
+        if not ENABLED:
+            return fn
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with _Span(name, None):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count(name, n=1):
+    if not ENABLED:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+# Called at the top of every page script. Spans recorded on this thread
+# belong to the rerun until the next call; spans from other threads
+# (delivery workers) are kept as background spans.
+def start_rerun(page):
+    if not ENABLED:
+        return
+    now = time.perf_counter_ns()
+    rss = rss_bytes()
+    rerun = {
+        "id": next(_rerun_ids),
+        "page": page,
+        "start_ns": now,
+        "end_ns": now,
+        "rss_start": rss,
+        "rss_end": rss,
+        "spans": [],
+    }
+    _local.rerun = rerun
+    with _lock:
+        _reruns.append(rerun)
+
+
+def reset():
+    with _lock:
+        _reruns.clear()
+        _background.clear()
+        _counters.clear()
+
+
+# =============================
+# Reading
+# =============================
+def counters():
+    with _lock:
+        return dict(_counters)
+
+
+def reruns():
+    with _lock:
+        recent = list(_reruns)
+    return [
+        {
+            "id": rerun["id"],
+            "page": rerun["page"],
+            "duration_ms": (rerun["end_ns"] - rerun["start_ns"]) / 1e6,
+            "rss_delta_mb": (rerun["rss_end"] - rerun["rss_start"]) / 1e6,
+            "spans": len(rerun["spans"]),
+        }
+        for rerun in recent
+    ]
+
+
+# Flat span records, each tagged with its rerun id and page ("background"
+# for spans outside a rerun)
+def iter_spans():
+    with _lock:
+        recent = list(_reruns)
+        background = list(_background)
+    for rerun in recent:
+        for record in list(rerun["spans"]):
+            yield dict(record, rerun=rerun["id"], page=rerun["page"])
+    for record in background:
+        yield dict(record, rerun=None, page="background")
+
+
+# Per span name across the recent reruns: count, p50, p95 and max in ms
+def span_stats(page=None):
+    durations = {}
+    for record in iter_spans():
+        if page is None or record["page"] == page:
+            durations.setdefault(record["name"], []).append(record["dur_us"] / 1000)
+
+    stats = []
+    for name, values in durations.items():
+        p50, p95 = np.percentile(values, [50, 95])
+        stats.append({
+            "span": name, "count": len(values),
+            "p50_ms": p50, "p95_ms": p95, "max_ms": max(values),
+        })
+    return sorted(stats, key=lambda row: row["p95_ms"], reverse=True)
+
+
+# =============================
+# Export
+# =============================
+def to_jsonl():
+    return "".join(json.dumps(record) + "\n" for record in iter_spans())
+
+
+# Chrome trace event format: open in chrome://tracing or ui.perfetto.dev.
+# One track per page; counters become a final counter event.
+def to_chrome_trace():
+    pid = os.getpid()
+    events = []
+    for record in iter_spans():
+        events.append({
+            "name": record["name"],
+            "ph": "X",
+            "ts": record["ts_us"],
+            "dur": record["dur_us"],
+            "pid": pid,
+            "tid": record["page"],
+            "args": dict(record.get("args", {}), rerun=record["rerun"]),
+        })
+    if _counters:
+        events.append({
+            "name": "counters",
+            "ph": "C",
+            "ts": (time.perf_counter_ns() - _T0_NS) / 1000,
+            "pid": pid,
+            "args": counters(),
+        })
+    return {"traceEvents": events, "otherData": {"started_at": _T0_EPOCH}}
+
+
+def export(path):
+    with open(path, "w", encoding="utf-8") as f:
+        if path.endswith(".json"):
+            json.dump(to_chrome_trace(), f)
+        else:
+            f.write(to_jsonl())
+
+
+if ENABLED and TRACE_FILE:
+    atexit.register(export, TRACE_FILE)
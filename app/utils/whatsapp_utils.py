@@ -1,21 +1,47 @@
+import os
+import threading
 import streamlit as st
-from twilio.rest import Client
-
-account_sid = st.secrets["TWILIO_ACCOUNT_SID"]
-auth_token = st.secrets["TWILIO_AUTH_TOKEN"]
-
-client = Client(account_sid, auth_token)
+from utils.tracing import traced
 
 TWILIO_WHATSAPP_FROM = "whatsapp:+14155238886"   # Twilio Sandbox number
 TWILIO_WHATSAPP_TO = "whatsapp:+917621992737"   # Your verified number
 
-def send_whatsapp_message(message):
-    client = Client(account_sid,auth_token)
+_delivery_queue = None
+_delivery_lock = threading.Lock()
+
+
+def get_credentials():
+    # Environment first (scheduled jobs), then .streamlit/secrets.toml
+    account_sid = os.environ.get("TWILIO_ACCOUNT_SID") or st.secrets["TWILIO_ACCOUNT_SID"]
+    auth_token = os.environ.get("TWILIO_AUTH_TOKEN") or st.secrets["TWILIO_AUTH_TOKEN"]
+    return account_sid, auth_token
+
+
+# One sender, session pool and worker set per process, created on first use.
+# requests and the outbox are only loaded once something is actually sent.
+def get_delivery_queue():
+    global _delivery_queue
+    with _delivery_lock:
+        if _delivery_queue is None:
+            from utils.delivery import TWILIO_API_BASE, DeliveryQueue, Outbox, TwilioSender
+
+            account_sid, auth_token = get_credentials()
+            sender = TwilioSender(
+                account_sid,
+                auth_token,
+                base_url=os.environ.get("TWILIO_API_BASE", TWILIO_API_BASE)
+            )
+            _delivery_queue = DeliveryQueue(
+                sender,
+                Outbox(),
+                workers=int(os.environ.get("WHATSAPP_WORKERS", 2)),
+                rate=float(os.environ.get("WHATSAPP_RATE_PER_S", 1.0))
+            ).start()
+    return _delivery_queue
 
-    msg = client.messages.create(
-        from_=TWILIO_WHATSAPP_FROM,
-        body=message,
-        to=TWILIO_WHATSAPP_TO
-    )
 
-    return msg.sid
+# Queues the message in the persisted outbox and returns its outbox id;
+# delivery happens on the background workers
+@traced("whatsapp.enqueue")
+def send_whatsapp_message(message, to=TWILIO_WHATSAPP_TO):
+    return get_delivery_queue().enqueue(TWILIO_WHATSAPP_FROM, to, message)
@@ -0,0 +1,106 @@
+"""WhatsApp delivery queue against a local mock of the Twilio Messages API.
+
+The mock adds a fixed latency and fails a share of requests with 500/429 so
+retries and backoff are exercised. Checks that every message ends up sent
+and prints throughput and latency.
+
+Run from the repo root:  python benchmarks/bench_delivery.py [messages]
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(BASE_DIR, "app"))
+
+from utils.delivery import DeliveryQueue, Outbox, TwilioSender
+
+API_LATENCY_S = 0.02
+FAILURE_RATE = 0.1
+
+
+class MockTwilioHandler(BaseHTTPRequestHandler):
+    received = []
+    lock = threading.Lock()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        form = parse_qs(self.rfile.read(length).decode())
+        time.sleep(API_LATENCY_S)
+
+        roll = random.random()
+        if roll < FAILURE_RATE / 2:
+            self._reply(500, {"message": "mock server error"})
+        elif roll < FAILURE_RATE:
+            self._reply(429, {"message": "mock rate limit"}, {"Retry-After": "0"})
+        else:
+            with self.lock:
+                self.received.append(form["Body"][0])
+            self._reply(201, {"sid": "SM" + uuid.uuid4().hex})
+
+    def _reply(self, status, payload, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+if __name__ == "__main__":
+    n_messages = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    random.seed(7)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockTwilioHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        outbox = Outbox(os.path.join(tmp_dir, "outbox.sqlite"))
+        queue = DeliveryQueue(
+            TwilioSender("ACmock", "token", base_url=base_url, pool_size=8),
+            outbox,
+            workers=8,
+            rate=500,
+            burst=50,
+            backoff_base=0.01,
+            backoff_max=0.1,
+        )
+
+        start = time.perf_counter()
+        queue.start()
+        queue.enqueue_many(
+            [("whatsapp:+10000000000", f"whatsapp:+1{i:010d}", f"message {i}") for i in range(n_messages)]
+        )
+        while outbox.status_counts().get("sent", 0) + outbox.status_counts().get("failed", 0) < n_messages:
+            time.sleep(0.05)
+        elapsed = time.perf_counter() - start
+        queue.stop()
+
+        metrics = queue.metrics()
+        status = outbox.status_counts()
+        outbox.close()
+
+    server.shutdown()
+
+    assert status.get("sent", 0) == n_messages, f"undelivered messages: {status}"
+    assert len(set(MockTwilioHandler.received)) == n_messages
+
+    print(f"Messages: {n_messages}  mock latency: {API_LATENCY_S * 1000:.0f} ms  "
+          f"failure rate: {FAILURE_RATE:.0%}")
+    print(f"Wall time: {elapsed:.2f}s  throughput: {n_messages / elapsed:.1f} msg/s  "
+          f"retries: {metrics['retries']}  failed: {metrics['failed']}")
+    print(f"End-to-end latency p50 {metrics['latency_p50_s']:.3f}s  p95 {metrics['latency_p95_s']:.3f}s")
+    print(f"API call latency   p50 {metrics['api_latency_p50_s']:.3f}s  p95 {metrics['api_latency_p95_s']:.3f}s")
@@ -0,0 +1,45 @@
+"""Row-wise .apply vs unique-value normalization engine at 1M rows.
+
+Run from the repo root:  python benchmarks/bench_normalization.py [rows]
+"""
+import os
+import sys
+import time
+
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(BASE_DIR, "app"))
+
+from utils.data_processing import clean_location, map_job_group
+from utils.normalization import normalize_job_groups, normalize_locations
+
+DATA_PATH = os.path.join(BASE_DIR, "Data", "Processed", "jobs_master.csv")
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    base = pd.read_csv(DATA_PATH, dtype=str)
+    df = base.sample(n=rows, replace=True, random_state=42).reset_index(drop=True)
+    print(f"Rows: {rows:,}  distinct locations: {df['location'].nunique():,}  "
+          f"distinct titles: {df['job_title'].nunique():,}")
+
+    cases = [
+        ("clean_location", "location", clean_location, normalize_locations),
+        ("map_job_group", "job_title", map_job_group, normalize_job_groups),
+    ]
+
+    for name, column, row_fn, engine_fn in cases:
+        expected, t_apply = timed(df[column].apply, row_fn)
+        result, t_engine = timed(engine_fn, df[column])
+
+        assert expected.equals(result), f"{name}: engine output differs from .apply"
+        print(f"{name:<16} apply {t_apply:7.3f}s   engine {t_engine:7.3f}s   "
+              f"speedup {t_apply / t_engine:6.1f}x")
@@ -0,0 +1,100 @@
+"""Recall and speed of the MinHash LSH similar-jobs index vs brute-force Jaccard.
+
+For a sample of query jobs, exact Jaccard similarity against every job is
+computed on the same feature sets (skill keys + title words). Reports, per
+number of bands used at query time, the share of true neighbours above
+--threshold that the index returns as candidates, recall@k of the ranked
+results (over true neighbours above the threshold), candidates per
+query and lookup time.
+
+Run from the repo root:  python benchmarks/bench_similarity.py [--queries 200] [--threshold 0.5]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(BASE_DIR, "app"))
+
+from utils.data_processing import preprocess_data
+from utils.similarity import SimilarJobsIndex, job_features
+
+DATA_PATH = os.path.join(BASE_DIR, "Data", "Processed", "jobs_master.csv")
+
+
+def feature_matrix(df):
+    indptr, tokens = job_features(df)
+    codes, vocabulary = pd.factorize(tokens)
+    data = np.ones(len(codes), dtype=np.float32)
+    return sparse.csr_matrix((data, codes, indptr), shape=(len(df), len(vocabulary)))
+
+
+# Exact Jaccard of each query row against all rows (queries x jobs)
+def exact_jaccard(features, queries):
+    sizes = np.asarray(features.sum(axis=1)).ravel()
+    intersection = (features[queries] @ features.T).toarray()
+    union = sizes[queries][:, np.newaxis] + sizes[np.newaxis, :] - intersection
+    with np.errstate(invalid="ignore", divide="ignore"):
+        jaccard = np.where(union > 0, intersection / union, 0.0)
+    jaccard[np.arange(len(queries)), queries] = 0.0
+    return jaccard
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", default=DATA_PATH)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--threshold", type=float, default=0.5)
+    parser.add_argument("-k", type=int, default=10)
+    args = parser.parse_args()
+
+    df = preprocess_data(pd.read_csv(args.data, dtype=str)).reset_index(drop=True)
+
+    start = time.perf_counter()
+    index = SimilarJobsIndex.from_frame(df)
+    print(f"Jobs: {len(df):,}  index build {time.perf_counter() - start:.2f}s  "
+          f"({index.bands} bands x {index.signatures.shape[1] // index.bands} rows)")
+
+    rng = np.random.default_rng(0)
+    queries = rng.choice(len(df), size=min(args.queries, len(df)), replace=False)
+
+    start = time.perf_counter()
+    jaccard = exact_jaccard(feature_matrix(df), queries)
+    brute_ms = (time.perf_counter() - start) * 1000 / len(queries)
+    true_neighbours = [set(np.flatnonzero(row >= args.threshold)) for row in jaccard]
+    print(f"Brute force: {brute_ms:.3f} ms/query  "
+          f"{np.mean([len(n) for n in true_neighbours]):.1f} neighbours >= {args.threshold} per query")
+
+    print(f"\n{'bands':>6} {'recall':>8} {'recall@' + str(args.k):>10} {'cands':>8} {'ms/query':>9}")
+    for bands in (4, 8, 16, 32):
+        if bands > index.bands:
+            continue
+        found = total = 0
+        hits_at_k = possible_at_k = 0
+        candidates = 0
+        elapsed = 0.0
+        for query, row_jaccard, truth in zip(queries, jaccard, true_neighbours):
+            start = time.perf_counter()
+            rows, _ = index.similar(query, k=args.k, bands=bands)
+            elapsed += time.perf_counter() - start
+
+            pool = set(index.candidates(query, bands).tolist())
+            candidates += len(pool)
+            found += len(truth & pool)
+            total += len(truth)
+
+            # Ties at the k-th score make several top-k sets correct, so a
+            # hit is any result scoring at least the true k-th best
+            top = np.sort(row_jaccard)[::-1][:args.k]
+            top = top[top >= args.threshold]
+            if len(top):
+                hits_at_k += min(len(top), int(np.sum(row_jaccard[rows] >= top[-1])))
+                possible_at_k += len(top)
+
+        print(f"{bands:>6} {found / max(total, 1):8.3f} {hits_at_k / max(possible_at_k, 1):10.3f} "
+              f"{candidates / len(queries):8.1f} {elapsed * 1000 / len(queries):9.3f}")
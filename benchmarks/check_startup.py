@@ -0,0 +1,37 @@
+"""Cold-start budget check for app/app.py.
+
+Exits non-zero when the import time of the landing page exceeds the budget
+(best of --runs, to ride out noise) or when it loads a heavy library that
+only later pages need.
+
+Run from the repo root:  python benchmarks/check_startup.py [--budget-ms 1500]
+"""
+import argparse
+import os
+import sys
+
+from startup_profile import APP_DIR, heavy_modules_loaded, profile_entry
+
+ENTRY_POINT = os.path.join(APP_DIR, "app.py")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=1500.0)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    profiles = [profile_entry(ENTRY_POINT) for _ in range(args.runs)]
+    best_ms = min(profile["import_ms"] for profile in profiles)
+    heavy = heavy_modules_loaded(set.union(*(profile["modules"] for profile in profiles)))
+
+    failures = []
+    if best_ms > args.budget_ms:
+        failures.append(f"import time {best_ms:.1f} ms exceeds budget {args.budget_ms:.0f} ms")
+    if heavy:
+        failures.append(f"heavy modules imported at startup: {', '.join(heavy)}")
+
+    print(f"app/app.py imports: {best_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,39 @@
+"""Bytes per row of the processed job table: all-object strings vs compact schema.
+
+Run from the repo root:  python benchmarks/memory_report.py
+"""
+import os
+import sys
+
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(BASE_DIR, "app"))
+
+from utils.data_processing import compact_schema, preprocess_data
+
+DATA_PATH = os.path.join(BASE_DIR, "Data", "Processed", "jobs_master.csv")
+
+
+def bytes_per_row(df):
+    return df.memory_usage(deep=True, index=False) / max(len(df), 1)
+
+
+if __name__ == "__main__":
+    before = preprocess_data(pd.read_csv(DATA_PATH, dtype=str)).reset_index(drop=True)
+    after = compact_schema(before)
+
+    report = pd.DataFrame({
+        "before_dtype": before.dtypes.astype(str),
+        "after_dtype": after.dtypes.astype(str),
+        "before_B/row": bytes_per_row(before).round(1),
+        "after_B/row": bytes_per_row(after).round(1),
+    })
+
+    print(f"Rows: {len(before):,}\n")
+    print(report.to_string())
+
+    total_before = bytes_per_row(before).sum()
+    total_after = bytes_per_row(after).sum()
+    print(f"\nTotal: {total_before:.1f} -> {total_after:.1f} bytes/row "
+          f"({total_before / total_after:.1f}x smaller)")
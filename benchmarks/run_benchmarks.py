@@ -0,0 +1,298 @@
+"""Benchmark suite for the load, preprocess, filter and aggregate hot paths.
+
+Every case runs against jobs_master.csv tiled 1x, 10x, 100x and 1000x. Each
+scale runs in its own interpreter, so a scale that runs out of memory is
+recorded as failed and does not take down the whole run. Reports the best
+of --repeat wall times plus the tracemalloc peak of one extra run. Results
+are saved as JSON tagged with the git commit.
+
+Run from the repo root:
+    python benchmarks/run_benchmarks.py [--scales 1,10] [--cases load_data,...] [--repeat 3]
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/OLD.json benchmarks/results/NEW.json
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(BASE_DIR, "app"))
+sys.path.append(os.path.join(BASE_DIR, "ml"))
+
+from utils import data_loader
+from utils.count_cube import CountCube
+from utils.data_processing import compact_schema, preprocess_data
+from utils.experience_index import ExperienceIndex
+from utils.filter_index import FilterIndex
+from utils.normalization import normalize_job_groups, normalize_locations
+from utils.skill_matrix import SkillMatrix
+
+DATA_PATH = os.path.join(BASE_DIR, "Data", "Processed", "jobs_master.csv")
+TAXONOMY_PATH = os.path.join(BASE_DIR, "Data", "Reference", "skill_taxonomy.csv")
+RESULTS_DIR = os.path.join(BASE_DIR, "benchmarks", "results")
+
+DEFAULT_SCALES = [1, 10, 100, 1000]
+
+
+# =============================
+# Inputs (built before timing)
+# =============================
+class ScaledInputs:
+
+    def __init__(self, scale, tmp_dir):
+        self.scale = scale
+        self.tmp_dir = tmp_dir
+        self._built = {}
+
+    def get(self, kind):
+        if kind not in self._built:
+            self._built[kind] = getattr(self, f"_build_{kind}")()
+        return self._built[kind]
+
+    def _build_raw(self):
+        base = pd.read_csv(DATA_PATH, dtype=str)
+        return pd.concat([base] * self.scale, ignore_index=True)
+
+    def _build_csv_path(self):
+        path = os.path.join(self.tmp_dir, f"jobs_master_x{self.scale}.csv")
+        self.get("raw").to_csv(path, index=False)
+        return path
+
+    def _build_processed(self):
+        return compact_schema(preprocess_data(self.get("raw").copy()))
+
+    # The Dashboard's cached structures, built once per scale like the app
+    def _build_dashboard(self):
+        processed = self.get("processed")
+        return CountCube.from_frame(processed), FilterIndex(processed), ExperienceIndex(processed)
+
+    def _build_descriptions(self):
+        from preprocessing import clean_text
+
+        descriptions = self.get("raw")["job_description"].fillna("")
+        return pd.DataFrame({"clean_description": descriptions.map(clean_text)})
+
+
+# =============================
+# Cases
+# =============================
+def bench_load_data(csv_path):
+    data_loader.DATA_PATH = csv_path
+    return data_loader.load_data.__wrapped__()
+
+
+def bench_preprocess_data(raw):
+    return preprocess_data(raw.copy(deep=False))
+
+
+def bench_clean_location(raw):
+    return normalize_locations(raw["location"])
+
+
+def bench_map_job_group(raw):
+    return normalize_job_groups(raw["job_title"])
+
+
+# One Dashboard rerun with two roles and two cities picked in the sidebar:
+# KPIs, charts and insight from the count cube, plus the "open to your
+# experience" bitmap AND
+def bench_dashboard_filter(dashboard):
+    cube, filter_index, experience_index = dashboard
+    filters = {
+        "job_group": ["Data Engineer", "Data Scientist"],
+        "clean_location": ["Bengaluru", "Pune"],
+    }
+    open_count = filter_index.count(
+        filter_index.select(**filters) & experience_index.select(3, 5)
+    )
+    return (
+        cube.total(**filters),
+        cube.nunique("job_group", **filters),
+        cube.nunique("clean_location", **filters),
+        [cube.counts_by(axis, **filters) for axis in ("job_group", "clean_location", "experience")],
+        cube.top("experience", **filters),
+        open_count,
+    )
+
+
+# Index build plus the Dashboard "open to 4 years" and range lookups
+def bench_experience_index(processed):
+    index = ExperienceIndex(processed)
+    return index.count(4), index.select(3, 7)
+
+
+# The string path Skills Insights used before the skill matrix
+def bench_skills_explode(processed):
+    skills = (
+        processed["skills_extracted"]
+        .dropna()
+        .str.lower()
+        .str.split(",")
+        .explode()
+        .str.strip()
+    )
+    return skills[skills != ""].value_counts().head(10)
+
+
+def bench_skill_matrix(processed):
+    return SkillMatrix.from_frame(processed).top_skills(10)
+
+
+def bench_generate_skill_counts(descriptions):
+    from skill_extraction import generate_skill_counts
+
+    return generate_skill_counts(descriptions, TAXONOMY_PATH)
+
+
+CASES = [
+    ("load_data", "csv_path", bench_load_data),
+    ("preprocess_data", "raw", bench_preprocess_data),
+    ("clean_location", "raw", bench_clean_location),
+    ("map_job_group", "raw", bench_map_job_group),
+    ("dashboard_filter", "dashboard", bench_dashboard_filter),
+    ("experience_index", "processed", bench_experience_index),
+    ("skills_explode", "processed", bench_skills_explode),
+    ("skill_matrix", "processed", bench_skill_matrix),
+    ("generate_skill_counts", "descriptions", bench_generate_skill_counts),
+]
+
+
+# Best-of-repeat wall time plus the tracemalloc peak of one extra run
+def measure(fn, arg, repeat):
+    tracemalloc.start()
+    fn(arg)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(arg)
+        times.append(time.perf_counter() - start)
+    return min(times), peak
+
+
+def run_scale(scale, case_names, repeat):
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        inputs = ScaledInputs(scale, tmp_dir)
+        for name, kind, fn in CASES:
+            if name not in case_names:
+                continue
+            arg = inputs.get(kind)
+            seconds, peak = measure(fn, arg, repeat)
+            rows = len(inputs.get("raw"))
+            results.append({
+                "case": name, "scale": scale, "rows": rows,
+                "seconds": seconds, "rows_per_s": rows / seconds if seconds else None,
+                "peak_mb": peak / 1e6,
+            })
+            print(f"  {name:<22} x{scale:<5} {seconds:9.4f}s  peak {peak / 1e6:9.1f} MB",
+                  file=sys.stderr, flush=True)
+    return results
+
+
+# =============================
+# Runner
+# =============================
+def git_commit():
+    def git(*args):
+        return subprocess.run(["git", *args], cwd=BASE_DIR, capture_output=True, text=True).stdout.strip()
+
+    return git("rev-parse", "HEAD") or "unknown", bool(git("status", "--porcelain", "--untracked-files=no"))
+
+
+def run_suite(scales, case_names, repeat):
+    results = []
+    for scale in scales:
+        print(f"scale x{scale}", file=sys.stderr, flush=True)
+        child = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--scale-worker", str(scale),
+             "--cases", ",".join(case_names), "--repeat", str(repeat)],
+            cwd=BASE_DIR, stdout=subprocess.PIPE, text=True
+        )
+        if child.returncode == 0:
+            results.extend(json.loads(child.stdout.strip().splitlines()[-1]))
+        else:
+            print(f"  scale x{scale} failed (exit {child.returncode})", file=sys.stderr)
+            results.extend(
+                {"case": name, "scale": scale, "error": f"exit {child.returncode}"}
+                for name in case_names
+            )
+    return results
+
+
+def compare(base_path, new_path, threshold):
+    with open(base_path, encoding="utf-8") as f:
+        base = json.load(f)
+    with open(new_path, encoding="utf-8") as f:
+        new = json.load(f)
+
+    base_results = {(r["case"], r["scale"]): r for r in base["results"] if "seconds" in r}
+    regressions = 0
+
+    print(f"base {base['commit'][:10]}  ->  new {new['commit'][:10]}")
+    print(f"{'case':<22} {'scale':>6} {'base s':>10} {'new s':>10} {'time':>7} {'memory':>7}")
+    for result in new["results"]:
+        old = base_results.get((result["case"], result["scale"]))
+        if old is None or "seconds" not in result:
+            continue
+        time_ratio = result["seconds"] / old["seconds"] if old["seconds"] else float("inf")
+        memory_ratio = result["peak_mb"] / old["peak_mb"] if old["peak_mb"] else float("inf")
+        flag = ""
+        if time_ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"{result['case']:<22} {'x' + str(result['scale']):>6} {old['seconds']:10.4f} "
+              f"{result['seconds']:10.4f} {time_ratio:6.2f}x {memory_ratio:6.2f}x{flag}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", default=",".join(map(str, DEFAULT_SCALES)))
+    parser.add_argument("--cases", default=",".join(name for name, _, _ in CASES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="results file (default benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NEW"))
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="slowdown ratio reported as a regression in --compare")
+    parser.add_argument("--scale-worker", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(1 if compare(*args.compare, args.threshold) else 0)
+
+    case_names = args.cases.split(",")
+    unknown = set(case_names) - {name for name, _, _ in CASES}
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+
+    if args.scale_worker:
+        print(json.dumps(run_scale(args.scale_worker, case_names, args.repeat)))
+        sys.exit(0)
+
+    commit, dirty = git_commit()
+    report = {
+        "commit": commit,
+        "dirty": dirty,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "repeat": args.repeat,
+        "results": run_suite([int(s) for s in args.scales.split(",")], case_names, args.repeat),
+    }
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit[:10]}{'-dirty' if dirty else ''}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Saved {output}")
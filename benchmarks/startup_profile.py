@@ -0,0 +1,76 @@
+"""Cold-start import profile of every Streamlit entry point (python -X importtime).
+
+Each entry point runs in a fresh interpreter with app/ on the path, the same
+way `streamlit run` executes a page script. Reports total import time, wall
+time, the slowest top-level imports and which heavy libraries got loaded.
+
+Run from the repo root:  python benchmarks/startup_profile.py [--top 8]
+"""
+import argparse
+import glob
+import os
+import re
+import subprocess
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_DIR = os.path.join(BASE_DIR, "app")
+
+ENTRY_POINTS = [os.path.join(APP_DIR, "app.py")] + sorted(
+    glob.glob(os.path.join(APP_DIR, "pages", "*.py"))
+)
+
+# Libraries that should only load when a page actually needs them. streamlit
+# itself pulls in the plotly package stub, so the check is on plotly.express.
+HEAVY_MODULES = ["plotly.express", "scipy", "sklearn", "twilio", "requests", "matplotlib", "seaborn"]
+
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)$")
+
+
+# Returns {"import_ms", "wall_ms", "top", "modules"} for one script
+def profile_entry(path):
+    env = dict(os.environ, PYTHONPATH=APP_DIR)
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", path],
+        cwd=BASE_DIR, env=env, capture_output=True, text=True
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    modules = set()
+    top = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, name = match.groups()
+        modules.add(name)
+        if len(indent) == 1:
+            top.append((name, int(cumulative) / 1000))
+
+    return {
+        "import_ms": sum(ms for _, ms in top),
+        "wall_ms": wall_ms,
+        "top": sorted(top, key=lambda item: item[1], reverse=True),
+        "modules": modules,
+    }
+
+
+def heavy_modules_loaded(modules):
+    return [name for name in HEAVY_MODULES if name in modules]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=8, help="slowest imports to list")
+    args = parser.parse_args()
+
+    for path in ENTRY_POINTS:
+        profile = profile_entry(path)
+        heavy = heavy_modules_loaded(profile["modules"])
+        print(f"\n{os.path.relpath(path, BASE_DIR)}")
+        print(f"  imports {profile['import_ms']:8.1f} ms   wall {profile['wall_ms']:8.1f} ms")
+        print(f"  heavy   {', '.join(heavy) if heavy else '-'}")
+        for name, ms in profile["top"][:args.top]:
+            print(f"  {ms:9.1f} ms  {name}")
@@ -0,0 +1,77 @@
+from collections import deque
+
+
+def is_word_char(ch):
+    return ch.isalnum()
+
+
+# Multi-pattern matcher: one linear pass over the text finds every
+# occurrence of every pattern (Aho-Corasick automaton).
+class AhoCorasick:
+
+    def __init__(self, patterns):
+        # patterns: iterable of (pattern, value); first value wins on clashes
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+
+        for pattern, value in patterns:
+            if not pattern:
+                continue
+            node = 0
+            for ch in pattern:
+                nxt = self.goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[node][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                node = nxt
+            if not self.output[node]:
+                self.output[node].append((len(pattern), value))
+
+        self._build_failure_links()
+
+    def _build_failure_links(self):
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self.goto[node].items():
+                queue.append(nxt)
+                state = self.fail[node]
+                while state and ch not in self.goto[state]:
+                    state = self.fail[state]
+                self.fail[nxt] = self.goto[state].get(ch, 0)
+                self.output[nxt] = self.output[nxt] + self.output[self.fail[nxt]]
+
+    def iter_matches(self, text):
+        goto, fail, output = self.goto, self.fail, self.output
+        node = 0
+        for end, ch in enumerate(text, 1):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for length, value in output[node]:
+                yield end - length, end, value
+
+    # Matches that sit on word boundaries, dropping any match contained in a
+    # longer one ("sql" inside "sql server", "sql" inside "nosql")
+    def find_words(self, text):
+        n = len(text)
+        matches = [
+            (start, end, value)
+            for start, end, value in self.iter_matches(text)
+            if (start == 0 or not is_word_char(text[start - 1]))
+            and (end == n or not is_word_char(text[end]))
+        ]
+        matches.sort(key=lambda m: (m[0], -m[1]))
+
+        kept = []
+        covered_to = -1
+        for start, end, value in matches:
+            if end <= covered_to:
+                continue
+            kept.append((start, end, value))
+            covered_to = max(covered_to, end)
+        return kept
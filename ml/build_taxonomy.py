@@ -0,0 +1,248 @@
+import argparse
+import pandas as pd
+from skill_extraction import match_key
+
+# -----------------------------
+# Paths
+# -----------------------------
+JOBS_PATH = "Data/Processed/jobs_master.csv"
+TAXONOMY_PATH = "Data/Reference/skill_taxonomy.csv"
+
+# =============================
+# SEED TAXONOMY
+# canonical skill -> synonyms / spelling variants
+# =============================
+SEED_TAXONOMY = {
+    "python": ["python3", "python 3", "pyhton"],
+    "r": ["r programming", "r language"],
+    "sql": ["structured query language", "t-sql", "tsql", "pl/sql", "plsql", "sqls", "slq"],
+    "nosql": ["no sql", "no-sql"],
+    "java": ["core java", "java 8"],
+    "scala": [],
+    "c++": ["cpp", "c plus plus"],
+    "c#": ["c sharp", "csharp"],
+    ".net": ["dot net", "dotnet"],
+    "javascript": ["java script", "js", "ecmascript"],
+    "typescript": ["type script"],
+    "golang": ["go lang"],
+    "rust": [],
+    "matlab": [],
+    "sas": ["base sas", "sas programming"],
+    "spss": ["ibm spss"],
+    "julia": [],
+    "bash": ["shell scripting", "shell script", "unix shell"],
+    "machine learning": ["ml", "machine learning algorithms", "machinelearning", "machine-learning"],
+    "deep learning": ["dl", "deep neural networks", "deep-learning"],
+    "artificial intelligence": ["ai"],
+    "natural language processing": ["nlp", "text mining", "text analytics"],
+    "computer vision": ["image processing", "computervision"],
+    "generative ai": ["genai", "gen ai", "generative artificial intelligence"],
+    "large language models": ["llm", "llms"],
+    "reinforcement learning": ["rl"],
+    "neural networks": ["neural network", "ann"],
+    "convolutional neural networks": ["cnn", "cnns"],
+    "recurrent neural networks": ["rnn", "lstm"],
+    "transformers": ["bert", "gpt"],
+    "statistics": ["statistical analysis", "statistical modeling", "statistical modelling"],
+    "predictive modeling": ["predictive modelling", "predictive analytics"],
+    "time series": ["time series analysis", "forecasting"],
+    "regression": ["linear regression", "logistic regression"],
+    "classification": [],
+    "clustering": ["k-means", "kmeans"],
+    "a/b testing": ["ab testing", "split testing"],
+    "hypothesis testing": [],
+    "data mining": [],
+    "data analysis": ["data analytics", "analytics"],
+    "data visualization": ["data visualisation", "visualization", "dataviz"],
+    "data modeling": ["data modelling"],
+    "data warehousing": ["data warehouse", "dwh", "edw"],
+    "data engineering": [],
+    "data governance": [],
+    "data quality": [],
+    "etl": ["extract transform load", "elt"],
+    "big data": ["bigdata"],
+    "feature engineering": [],
+    "mlops": ["ml ops"],
+    "model deployment": ["model serving"],
+    "pandas": [],
+    "numpy": [],
+    "scipy": [],
+    "scikit-learn": ["sklearn", "scikit learn"],
+    "tensorflow": ["tensor flow", "tensorflo"],
+    "keras": [],
+    "pytorch": ["torch"],
+    "xgboost": [],
+    "lightgbm": [],
+    "opencv": ["open cv"],
+    "nltk": [],
+    "spacy": [],
+    "hugging face": ["huggingface"],
+    "langchain": [],
+    "matplotlib": [],
+    "seaborn": [],
+    "plotly": [],
+    "tableau": [],
+    "power bi": ["powerbi", "microsoft power bi"],
+    "qlik": ["qlikview", "qlik sense"],
+    "looker": [],
+    "excel": ["ms excel", "microsoft excel", "advanced excel"],
+    "spark": ["apache spark"],
+    "pyspark": ["py spark"],
+    "hadoop": ["apache hadoop", "hdfs"],
+    "hive": ["apache hive"],
+    "kafka": ["apache kafka"],
+    "airflow": ["apache airflow", "air flow"],
+    "flink": ["apache flink"],
+    "databricks": ["data bricks"],
+    "snowflake": [],
+    "bigquery": ["big query", "biqquery", "google bigquery"],
+    "redshift": ["amazon redshift"],
+    "dbt": [],
+    "mysql": ["my sql"],
+    "postgresql": ["postgres", "postgre sql"],
+    "oracle": ["oracle db", "oracle database"],
+    "sql server": ["mssql", "ms sql", "microsoft sql server"],
+    "mongodb": ["mongo db", "mongo"],
+    "cassandra": [],
+    "redis": [],
+    "elasticsearch": ["elastic search"],
+    "aws": ["amazon web services"],
+    "azure": ["microsoft azure", "ms azure"],
+    "gcp": ["google cloud", "google cloud platform"],
+    "cloud computing": ["cloud"],
+    "docker": ["containers", "containerization"],
+    "kubernetes": ["k8s"],
+    "terraform": [],
+    "jenkins": [],
+    "ci/cd": ["cicd", "ci cd", "continuous integration"],
+    "git": ["github", "gitlab"],
+    "linux": ["unix"],
+    "devops": ["dev ops"],
+    "rest api": ["rest apis", "restful", "restful api"],
+    "microservices": ["micro services"],
+    "flask": [],
+    "django": [],
+    "fastapi": ["fast api"],
+    "react": ["reactjs", "react.js"],
+    "node.js": ["nodejs", "node js"],
+    "html": ["html5"],
+    "css": ["css3"],
+    "agile": ["scrum"],
+    "jira": [],
+    "project management": [],
+    "business intelligence": ["bi"],
+    "business analysis": [],
+    "communication": ["communication skills"],
+    "quality assurance": ["qa"],
+    "user experience": ["ux", "ux design"],
+    "user interface": ["ui", "ui design"],
+    "human resources": ["hr"],
+    "lead generation": [],
+    "google tag manager": ["gtm"],
+    "problem solving": [],
+}
+
+
+# =============================
+# STOPLIST
+# The corpus skill lists mix in job titles, departments and filler words.
+# A corpus term is dropped when it names a role ("data scientist",
+# "manager technology"), or when what is left after the filler words is
+# nothing or a single broad word ("analysis", "analytical skills").
+# Multi-word terms built from broad words ("financial analysis") stay.
+# =============================
+FILLER_WORDS = {
+    "basic", "advanced", "good", "strong", "excellent", "ability",
+    "skills", "skill", "hands", "on", "and", "of", "in", "for", "with", "the",
+    "to", "tools", "tool", "concepts",
+}
+
+BROAD_TERMS = {
+    # too broad to be a skill on their own
+    "analysis", "analytical", "operations", "management", "business", "process",
+    "it", "technology", "technical", "information", "services", "service",
+    "solutions", "support", "development", "design", "engineering", "programming",
+    "coding", "research", "architecture", "workflow", "reporting", "planning",
+    "documentation", "database", "databases", "stores", "backend", "software",
+    "written", "verbal", "oral", "english",
+    # departments and industries
+    "sales", "marketing", "finance", "financial", "accounting", "administration",
+    "billing", "healthcare", "pharma", "publishing", "insurance", "banking",
+    "retail", "consulting", "training", "procurement", "bpo", "kpo",
+    # vendors, meaningful only with a product name
+    "microsoft", "google", "apache", "amazon", "ibm", "com", "go",
+    # short words that match ordinary text (and "San Francisco", "CA")
+    "san", "ca", "min", "law", "pub", "ups", "tam", "pwd", "phd", "emi", "ipo",
+    "cxo", "cio", "ict", "mba", "be", "se", "fresher", "freshers",
+}
+
+ROLE_WORDS = {
+    "analyst", "analysts", "engineer", "engineers", "scientist", "scientists",
+    "developer", "developers", "manager", "managers", "consultant", "architect",
+    "specialist", "executive", "lead", "associate", "intern", "trainee",
+    "administrator", "officer", "head", "director",
+}
+
+# Corpus terms shorter than 3 characters ("rf", "3g") are mostly noise;
+# they need this many times the usual support. Seeds cover the real ones.
+SHORT_TERM_SUPPORT = 3
+
+
+def is_stop_term(key):
+    words = key.split()
+    if any(word in ROLE_WORDS for word in words):
+        return True
+    words = [word for word in words if word not in FILLER_WORDS]
+    return len(words) == 0 or (len(words) == 1 and words[0] in BROAD_TERMS)
+
+
+def normalize_skill(skill):
+    return " ".join(str(skill).lower().split())
+
+
+# Corpus skills with their posting counts, most frequent first
+def corpus_skills(path, min_count):
+    df = pd.read_csv(path, dtype=str, usecols=["skills_extracted"])
+    skills = df["skills_extracted"].dropna().str.split(",").explode().map(normalize_skill)
+    counts = skills[skills != ""].value_counts()
+    return counts[counts >= min_count]
+
+
+# Seeds first, then frequent corpus skills whose match form is not
+# already claimed by a seed skill, synonym or earlier corpus skill, and
+# is not on the stoplist or too short for its support
+def build_taxonomy(jobs_path=JOBS_PATH, min_count=3):
+    rows = []
+    seen = set()
+
+    for skill, synonyms in SEED_TAXONOMY.items():
+        rows.append({"skill": skill, "synonyms": "|".join(synonyms)})
+        seen.update(match_key(term) for term in [skill] + synonyms)
+
+    for skill, count in corpus_skills(jobs_path, min_count).items():
+        key = match_key(skill)
+        if len(key) < 2 or key.isdigit() or key in seen or is_stop_term(key):
+            continue
+        if len(key) < 3 and count < SHORT_TERM_SUPPORT * min_count:
+            continue
+        rows.append({"skill": skill, "synonyms": ""})
+        seen.add(key)
+
+    taxonomy = pd.DataFrame(rows)
+    taxonomy.insert(0, "skill_id", range(len(taxonomy)))
+    return taxonomy
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the skill taxonomy used by skill_extraction.py")
+    parser.add_argument("--jobs", default=JOBS_PATH)
+    parser.add_argument("--output", default=TAXONOMY_PATH)
+    parser.add_argument("--min-count", type=int, default=3)
+    args = parser.parse_args()
+
+    taxonomy = build_taxonomy(args.jobs, args.min_count)
+    taxonomy.to_csv(args.output, index=False)
+
+    print("✅ Taxonomy built")
+    print("📄 File created:", args.output)
+    print("📊 Skills:", len(taxonomy))
@@ -1,94 +1,228 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+import pandas as pd
 
 # -----------------------------
 # Paths
 # -----------------------------
 DATA_PATH = Path("Data/Processed/jobs_master.csv")
+MANIFEST_PATH = Path("Data/Processed/manifest.json")
 OUTPUT_DIR = Path("EDA/outputs")
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+FINGERPRINTS_PATH = OUTPUT_DIR / ".fingerprints.json"
+
 
 # -----------------------------
-# Load data
+# Plotting helpers
+# matplotlib is only imported inside chart tasks, always with the
+# non-interactive Agg backend.
 # -----------------------------
-df = pd.read_csv(DATA_PATH)
+def get_pyplot():
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
 
-print("✅ Dataset Loaded")
-print("Shape:", df.shape)
-print("\nColumns:\n", df.columns)
 
-# -----------------------------
-# Basic Info
-# -----------------------------
-print("\n🔹 Data Info")
-print(df.info())
+def save_figure(plt, output):
+    plt.tight_layout()
+    plt.savefig(output)
+    plt.close()
 
-print("\n🔹 Missing Values (%)")
-print((df.isnull().mean() * 100).sort_values(ascending=False))
 
 # -----------------------------
 # 1️⃣ Job Role Distribution
 # -----------------------------
-if "job_title" in df.columns:
+def plot_top_job_roles(values, output):
+    plt = get_pyplot()
     plt.figure(figsize=(10, 5))
-    df["job_title"].value_counts().head(10).plot(kind="bar")
+    values.value_counts().head(10).plot(kind="bar")
     plt.title("Top 10 Job Roles")
     plt.ylabel("Count")
     plt.xticks(rotation=45)
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / "top_job_roles.png")
-    plt.close()
+    save_figure(plt, output)
+
 
 # -----------------------------
 # 2️⃣ Location Distribution
 # -----------------------------
-if "location" in df.columns:
+def plot_top_locations(values, output):
+    plt = get_pyplot()
     plt.figure(figsize=(10, 5))
-    df["location"].value_counts().head(10).plot(kind="bar", color="orange")
+    values.value_counts().head(10).plot(kind="bar", color="orange")
     plt.title("Top Job Locations")
     plt.ylabel("Count")
     plt.xticks(rotation=45)
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / "top_locations.png")
-    plt.close()
+    save_figure(plt, output)
+
 
 # -----------------------------
 # 3️⃣ Experience Level
 # -----------------------------
-if "experience" in df.columns:
+def plot_experience(values, output):
+    plt = get_pyplot()
     plt.figure(figsize=(8, 4))
-    df["experience"].value_counts().plot(kind="bar", color="green")
+    values.value_counts().plot(kind="bar", color="green")
     plt.title("Experience Distribution")
     plt.ylabel("Count")
     plt.xticks(rotation=0)
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / "experience_distribution.png")
-    plt.close()
+    save_figure(plt, output)
+
 
 # -----------------------------
 # 4️⃣ Salary Distribution (if present)
 # -----------------------------
-if "salary" in df.columns:
+def plot_salary(values, output):
+    plt = get_pyplot()
     plt.figure(figsize=(8, 4))
-    sns.histplot(df["salary"].dropna(), bins=30, kde=True)
+    try:
+        import seaborn as sns
+        sns.histplot(values.dropna(), bins=30, kde=True)
+    except ImportError:
+        plt.hist(values.dropna(), bins=30)
     plt.title("Salary Distribution")
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / "salary_distribution.png")
-    plt.close()
+    save_figure(plt, output)
+
 
 # -----------------------------
 # 5️⃣ Source Dataset Split
 # -----------------------------
-if "source_dataset" in df.columns:
+def plot_source_split(values, output):
+    plt = get_pyplot()
     plt.figure(figsize=(6, 6))
-    df["source_dataset"].value_counts().plot(kind="pie", autopct="%1.1f%%")
+    values.value_counts().plot(kind="pie", autopct="%1.1f%%")
     plt.title("Data Source Distribution")
     plt.ylabel("")
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / "source_split.png")
-    plt.close()
+    save_figure(plt, output)
+
+
+# One task per chart. Bump "version" when a chart's code changes so its
+# previous output is not reused.
+CHARTS = [
+    {"name": "top_job_roles", "column": "job_title", "plot": plot_top_job_roles, "version": 1},
+    {"name": "top_locations", "column": "location", "plot": plot_top_locations, "version": 1},
+    {"name": "experience_distribution", "column": "experience", "plot": plot_experience, "version": 1},
+    {"name": "salary_distribution", "column": "salary", "plot": plot_salary, "version": 1,
+     "numeric": True},
+    {"name": "source_split", "column": "source_dataset", "plot": plot_source_split, "version": 1},
+]
+
+
+def chart_output(chart):
+    return OUTPUT_DIR / f"{chart['name']}.png"
+
+
+def column_fingerprint(values, chart):
+    digest = hashlib.sha1(f"{chart['name']}|v{chart['version']}".encode())
+    digest.update(pd.util.hash_pandas_object(values, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+# Size/mtime of the input plus the preprocess manifest version; when it is
+# unchanged the data does not even need to be read
+def source_fingerprint():
+    stat = DATA_PATH.stat()
+    manifest_version = 0
+    if MANIFEST_PATH.exists():
+        manifest_version = json.loads(MANIFEST_PATH.read_text(encoding="utf-8")).get("version", 0)
+    return f"{stat.st_size}-{stat.st_mtime_ns}-m{manifest_version}"
+
+
+def load_fingerprints():
+    if FINGERPRINTS_PATH.exists():
+        return json.loads(FINGERPRINTS_PATH.read_text(encoding="utf-8"))
+    return {"source": None, "charts": {}}
+
+
+def render_chart(name, values, output):
+    chart = next(c for c in CHARTS if c["name"] == name)
+    chart["plot"](values, output)
+    return name
+
+
+def print_summary(df):
+    print("✅ Dataset Loaded")
+    print("Shape:", df.shape)
+    print("\nColumns:\n", df.columns)
+
+    print("\n🔹 Data Info")
+    df.info()
+
+    print("\n🔹 Missing Values (%)")
+    print((df.isnull().mean() * 100).sort_values(ascending=False))
+
+
+# Renders every chart whose input changed since the last run, one process
+# per chart. Returns (rendered, skipped) chart names.
+def run_eda(workers=None, force=False, summary=False):
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    previous = load_fingerprints()
+    source = source_fingerprint()
+
+    versions = {chart["name"]: chart["version"] for chart in CHARTS}
+    up_to_date = (
+        not force and not summary
+        and previous["source"] == source
+        and previous.get("versions") == versions
+        and all(chart_output(c).exists() or c["name"] not in previous["charts"] for c in CHARTS)
+    )
+    # Only charts fingerprinted last run count as skipped; charts whose
+    # column is missing from the data were never rendered
+    if up_to_date:
+        return [], [chart["name"] for chart in CHARTS if chart["name"] in previous["charts"]]
+
+    header = pd.read_csv(DATA_PATH, nrows=0).columns
+    if summary:
+        df = pd.read_csv(DATA_PATH)
+        print_summary(df)
+    else:
+        needed = [chart["column"] for chart in CHARTS if chart["column"] in header]
+        df = pd.read_csv(DATA_PATH, usecols=needed)
+
+    fingerprints = {}
+    tasks = []
+    skipped = []
+    for chart in CHARTS:
+        if chart["column"] not in df.columns:
+            continue
+        values = df[chart["column"]]
+        if chart.get("numeric"):
+            values = pd.to_numeric(values, errors="coerce")
+
+        fingerprint = column_fingerprint(values, chart)
+        fingerprints[chart["name"]] = fingerprint
+        if not force and previous["charts"].get(chart["name"]) == fingerprint and chart_output(chart).exists():
+            skipped.append(chart["name"])
+        else:
+            tasks.append((chart["name"], values, chart_output(chart)))
+
+    if workers == 1 or len(tasks) <= 1:
+        rendered = [render_chart(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            rendered = list(pool.map(render_chart, *zip(*tasks)))
+
+    FINGERPRINTS_PATH.write_text(
+        json.dumps({"source": source, "versions": versions, "charts": fingerprints}, indent=2),
+        encoding="utf-8"
+    )
+    return rendered, skipped
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render EDA charts for jobs_master.csv")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--force", action="store_true", help="re-render every chart")
+    parser.add_argument("--summary", action="store_true",
+                        help="print shape, dtypes and missing values first")
+    args = parser.parse_args()
+
+    rendered, skipped = run_eda(args.workers, args.force, args.summary)
 
-print("\n✅ EDA Completed")
-print(f"📂 Plots saved in: {OUTPUT_DIR}")
+    print("\n✅ EDA Completed")
+    print("🖼️ Rendered:", ", ".join(rendered) if rendered else "none")
+    print("⏭️ Unchanged:", ", ".join(skipped) if skipped else "none")
+    print(f"📂 Plots saved in: {OUTPUT_DIR}")
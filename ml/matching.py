@@ -0,0 +1,211 @@
+import argparse
+import json
+import os
+import time
+import numpy as np
+import pandas as pd
+
+# -----------------------------
+# Paths
+# -----------------------------
+JOBS_PATH = "Data/Processed/jobs_master.csv"
+MODEL_DIR = "Data/Processed/matching"
+
+TEXT_COLUMNS = ["job_description", "skills_extracted"]
+RESULT_COLUMNS = ["job_title", "location", "experience"]
+
+TOP_K = 10
+BLOCK_SIZE = 512
+
+
+def source_fingerprint(path):
+    stat = os.stat(path)
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def job_texts(jobs):
+    return jobs[TEXT_COLUMNS].fillna("").agg(" ".join, axis=1)
+
+
+# Indices and scores of the k best entries of every row of a dense score
+# block, best first. argpartition keeps this O(jobs) per row instead of a
+# full sort.
+def top_k_rows(scores, k):
+    k = min(k, scores.shape[1])
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    top_scores = np.take_along_axis(scores, top, axis=1)
+    order = np.argsort(-top_scores, axis=1, kind="stable")
+    return np.take_along_axis(top, order, axis=1), np.take_along_axis(top_scores, order, axis=1)
+
+
+# Same for a sparse CSR score block, without densifying it: each row's
+# stored (non-zero) scores are partitioned straight from the CSR data.
+# Rows with fewer than k matches are padded with score 0 at job 0, which
+# match_results drops.
+def top_k_sparse_rows(scores, k):
+    k = min(k, scores.shape[1])
+    scores = scores.tocsr()
+    top = np.zeros((scores.shape[0], k), dtype=np.int64)
+    top_scores = np.zeros((scores.shape[0], k), dtype=scores.dtype)
+    for row in range(scores.shape[0]):
+        start, end = scores.indptr[row], scores.indptr[row + 1]
+        data, indices = scores.data[start:end], scores.indices[start:end]
+        if len(data) > k:
+            best = np.argpartition(-data, k - 1)[:k]
+            data, indices = data[best], indices[best]
+        order = np.lexsort((indices, -data))
+        top[row, :len(order)] = indices[order]
+        top_scores[row, :len(order)] = data[order]
+    return top, top_scores
+
+
+# -----------------------------
+# Matcher
+# TF-IDF over description + skills, one L2-normalised sparse row per job,
+# so a candidate's cosine similarity to every job is one sparse product.
+# -----------------------------
+class JobMatcher:
+
+    def __init__(self, vectorizer, job_vectors):
+        self.vectorizer = vectorizer
+        self.job_vectors = job_vectors
+
+    @classmethod
+    def build(cls, jobs):
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        vectorizer = TfidfVectorizer(
+            ngram_range=(1, 2), min_df=2, sublinear_tf=True,
+            stop_words="english", dtype=np.float32
+        )
+        job_vectors = vectorizer.fit_transform(job_texts(jobs)).tocsr()
+        return cls(vectorizer, job_vectors)
+
+    def save(self, model_dir, fingerprint):
+        import joblib
+        from scipy import sparse
+
+        os.makedirs(model_dir, exist_ok=True)
+        sparse.save_npz(os.path.join(model_dir, "job_vectors.npz"), self.job_vectors)
+        joblib.dump(self.vectorizer, os.path.join(model_dir, "vectorizer.joblib"))
+        with open(os.path.join(model_dir, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({"source": fingerprint, "jobs": self.job_vectors.shape[0],
+                       "features": self.job_vectors.shape[1]}, f, indent=2)
+
+    @classmethod
+    def load(cls, model_dir):
+        import joblib
+        from scipy import sparse
+
+        job_vectors = sparse.load_npz(os.path.join(model_dir, "job_vectors.npz")).tocsr()
+        vectorizer = joblib.load(os.path.join(model_dir, "vectorizer.joblib"))
+        return cls(vectorizer, job_vectors)
+
+    def vectorize(self, profiles):
+        return self.vectorizer.transform(profiles)
+
+    # Cosine score of one skill profile against every job (one mat-vec)
+    def score(self, profile):
+        query = self.vectorize([profile])
+        return (self.job_vectors @ query.T).toarray().ravel()
+
+    def top_k(self, profile, k=TOP_K):
+        top, scores = top_k_rows(self.score(profile)[np.newaxis, :], k)
+        return top[0], scores[0]
+
+    # Scores many profiles in blocks of rows: one sparse mat-mat product per
+    # block, kept sparse, so memory follows the matching (candidate, job)
+    # pairs rather than block_size x jobs. Yields (start, top, scores)
+    # per block.
+    def top_k_batch(self, profiles, k=TOP_K, block_size=BLOCK_SIZE):
+        for start in range(0, len(profiles), block_size):
+            queries = self.vectorize(profiles[start:start + block_size])
+            scores = queries @ self.job_vectors.T
+            top, top_scores = top_k_sparse_rows(scores, k)
+            yield start, top, top_scores
+
+
+# Loads the persisted matcher, rebuilding it when jobs_master.csv changed
+def load_matcher(jobs_path=JOBS_PATH, model_dir=MODEL_DIR, rebuild=False):
+    fingerprint = source_fingerprint(jobs_path)
+    meta_path = os.path.join(model_dir, "meta.json")
+    if not rebuild and os.path.exists(meta_path):
+        with open(meta_path, encoding="utf-8") as f:
+            if json.load(f).get("source") == fingerprint:
+                return JobMatcher.load(model_dir)
+
+    jobs = pd.read_csv(jobs_path, dtype=str, usecols=TEXT_COLUMNS)
+    matcher = JobMatcher.build(jobs)
+    matcher.save(model_dir, fingerprint)
+    return matcher
+
+
+# One row per (candidate, matched job). Jobs scoring 0 share no term with
+# the profile (empty or out-of-vocabulary skills) and are left out rather
+# than ranked arbitrarily; scores are sorted, so ranks stay 1..n.
+def match_results(jobs, candidate_ids, top, scores):
+    rows = np.repeat(np.arange(len(candidate_ids)), top.shape[1])
+    ranks = np.tile(np.arange(1, top.shape[1] + 1), len(candidate_ids))
+    keep = scores.ravel() > 0
+
+    result = jobs.iloc[top.ravel()[keep]].reset_index(names="job_index")
+    result.insert(0, "candidate_id", np.asarray(candidate_ids)[rows[keep]])
+    result.insert(1, "rank", ranks[keep])
+    result["score"] = scores.ravel()[keep].round(4)
+    return result
+
+
+# Scores a CSV of candidates (candidate_id, skills) against all jobs and
+# writes the top-k jobs per candidate. Returns (candidates, seconds).
+def match_candidates(candidates_path, output, k=TOP_K, block_size=BLOCK_SIZE,
+                     jobs_path=JOBS_PATH, model_dir=MODEL_DIR):
+    matcher = load_matcher(jobs_path, model_dir)
+    jobs = pd.read_csv(jobs_path, dtype=str, usecols=RESULT_COLUMNS)[RESULT_COLUMNS]
+
+    candidates = pd.read_csv(candidates_path, dtype=str)
+    if "candidate_id" not in candidates.columns:
+        candidates["candidate_id"] = candidates.index.astype(str)
+    profiles = candidates["skills"].fillna("").tolist()
+    ids = candidates["candidate_id"].to_numpy()
+
+    start_time = time.perf_counter()
+    with open(output, "w", newline="", encoding="utf-8") as out:
+        for start, top, scores in matcher.top_k_batch(profiles, k, block_size):
+            block = match_results(jobs, ids[start:start + len(top)], top, scores)
+            block.to_csv(out, header=start == 0, index=False)
+    return len(candidates), time.perf_counter() - start_time
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Match candidate skill profiles against jobs")
+    parser.add_argument("--skills", help='one profile, e.g. "python, sql, machine learning"')
+    parser.add_argument("--candidates", help="CSV with candidate_id and skills columns")
+    parser.add_argument("--output", default="Data/Processed/matches.csv")
+    parser.add_argument("--top", type=int, default=TOP_K)
+    parser.add_argument("--block-size", type=int, default=BLOCK_SIZE,
+                        help="candidates scored per sparse product")
+    parser.add_argument("--rebuild", action="store_true", help="re-vectorize the jobs")
+    args = parser.parse_args()
+
+    if args.rebuild or not (args.skills or args.candidates):
+        start = time.perf_counter()
+        matcher = load_matcher(rebuild=args.rebuild)
+        print(f"✅ Job vectors: {matcher.job_vectors.shape[0]:,} jobs x "
+              f"{matcher.job_vectors.shape[1]:,} features ({time.perf_counter() - start:.1f}s)")
+
+    if args.skills:
+        matcher = load_matcher()
+        jobs = pd.read_csv(JOBS_PATH, dtype=str, usecols=RESULT_COLUMNS)[RESULT_COLUMNS]
+        top, scores = matcher.top_k(args.skills, args.top)
+        result = match_results(jobs, ["-"], top[np.newaxis, :], scores[np.newaxis, :])
+        if result.empty:
+            print("No job shares a term with these skills.")
+        else:
+            print(result.drop(columns=["candidate_id"]).to_string(index=False))
+
+    if args.candidates:
+        candidates, seconds = match_candidates(args.candidates, args.output, args.top,
+                                               args.block_size)
+        print(f"✅ Matched {candidates:,} candidates in {seconds:.2f}s "
+              f"({candidates / seconds:,.0f} candidates/s)")
+        print("📄 File created:", args.output)
@@ -0,0 +1,214 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+# MinHash and the location rules live with the app
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+from utils.minhash import MinHasher, band_keys, token_hashes
+from utils.normalization import normalize_locations
+from utils.skill_matrix import skill_key, split_skills
+
+# -----------------------------
+# Paths
+# -----------------------------
+INPUT_PATH = "Data/Processed/jobs_exact.csv"
+OUTPUT_PATH = "Data/Processed/jobs_master.csv"
+REPORT_PATH = "Data/Processed/near_duplicates.csv"
+
+CHUNK_SIZE = 50_000
+PARTITIONS = 64
+
+NUM_PERM = 64
+BANDS = 16
+# Estimated skill-set Jaccard at or above which two postings in the same
+# block are the same posting
+THRESHOLD = 0.8
+
+# One fixed-width record per row, spilled to its block's partition file
+RECORD = np.dtype([("row", "<i8"), ("block", "<u8"), ("sig", "<u4", (NUM_PERM,))])
+
+REPORT_COLUMNS = ["cluster", "row", "canonical", "job_title", "location", "experience"]
+
+
+# -----------------------------
+# Keys
+# Postings are only compared within a block: same normalized title, same
+# canonical city and same experience text. Within a block, the skill list
+# is compared as a set, so order, case and spacing do not matter.
+# -----------------------------
+def normalize_title(titles):
+    return titles.fillna("").str.lower().str.findall(r"[a-z0-9+#]+").str.join(" ")
+
+
+def block_keys(chunk):
+    keys = pd.DataFrame({
+        "title": normalize_title(chunk["job_title"]),
+        "location": normalize_locations(chunk["location"]).fillna(""),
+        "experience": chunk["experience"].fillna("").str.strip(),
+    })
+    return pd.util.hash_pandas_object(keys, index=False).to_numpy()
+
+
+def skill_signatures(chunk, hasher):
+    skills = split_skills(chunk["skills_extracted"].reset_index(drop=True))
+    keys = skills.map(skill_key)
+    keys = keys[keys != ""]
+    frame = pd.DataFrame({"row": keys.index.to_numpy(), "key": keys.to_numpy()}).drop_duplicates()
+
+    counts = np.bincount(frame["row"].to_numpy(), minlength=len(chunk))
+    indptr = np.concatenate([[0], np.cumsum(counts)])
+    return hasher.signatures(indptr, token_hashes(frame["key"].to_numpy(dtype=object)))
+
+
+# -----------------------------
+# Pass 1: spill (row, block, signature) records to partition files by
+# block, so every block is complete inside one partition
+# -----------------------------
+def spill_partitions(input_path, spill_dir, chunk_size, partitions):
+    hasher = MinHasher(NUM_PERM)
+    files = [open(os.path.join(spill_dir, f"{p:03d}.bin"), "wb") for p in range(partitions)]
+    rows = 0
+    try:
+        for chunk in pd.read_csv(input_path, dtype=str, chunksize=chunk_size):
+            records = np.empty(len(chunk), dtype=RECORD)
+            records["row"] = np.arange(rows, rows + len(chunk))
+            records["block"] = block_keys(chunk)
+            records["sig"] = skill_signatures(chunk, hasher)
+
+            partition = records["block"] % np.uint64(partitions)
+            for p in np.unique(partition):
+                records[partition == p].tofile(files[int(p)])
+            rows += len(chunk)
+    finally:
+        for f in files:
+            f.close()
+    return rows
+
+
+# -----------------------------
+# Pass 2: cluster one partition. Rows in the same block that share an LSH
+# band bucket are candidate pairs; pairs whose signatures agree on at
+# least THRESHOLD of the hashes are linked, and linked rows form clusters
+# (connected components). Returns (rows, canonical row per row) where the
+# canonical row is the cluster's first row in file order.
+# -----------------------------
+def cluster_partition(records, threshold):
+    from scipy import sparse
+    from scipy.sparse.csgraph import connected_components
+
+    n = len(records)
+    signatures = records["sig"]
+    blocks = records["block"]
+    keys = band_keys(signatures, BANDS)
+
+    sources, targets = [], []
+    for band in range(BANDS):
+        order = np.lexsort((keys[:, band], blocks))
+        same = (blocks[order][1:] == blocks[order][:-1]) & \
+               (keys[order, band][1:] == keys[order, band][:-1])
+        a, b = order[:-1][same], order[1:][same]
+        linked = (signatures[a] == signatures[b]).mean(axis=1) >= threshold
+        sources.append(a[linked])
+        targets.append(b[linked])
+
+    sources = np.concatenate(sources)
+    targets = np.concatenate(targets)
+    graph = sparse.coo_matrix(
+        (np.ones(len(sources), dtype=np.int8), (sources, targets)), shape=(n, n)
+    )
+    n_clusters, labels = connected_components(graph, directed=False)
+
+    canonical = np.full(n_clusters, np.iinfo(np.int64).max, dtype=np.int64)
+    np.minimum.at(canonical, labels, records["row"])
+    return records["row"], canonical[labels]
+
+
+# -----------------------------
+# Pass 3: stream the input again, keeping canonical rows and reporting
+# every member of a multi-row cluster
+# -----------------------------
+def write_output(input_path, output_path, report_path, canonical, cluster_sizes, chunk_size):
+    start = 0
+    with open(output_path, "w", newline="", encoding="utf-8") as out, \
+            open(report_path, "w", newline="", encoding="utf-8") as report:
+        pd.DataFrame(columns=REPORT_COLUMNS).to_csv(report, index=False)
+        header = True
+        for chunk in pd.read_csv(input_path, dtype=str, chunksize=chunk_size):
+            rows = np.arange(start, start + len(chunk))
+            chunk_canonical = canonical[rows]
+
+            chunk[chunk_canonical == rows].to_csv(out, header=header, index=False)
+            header = False
+
+            in_cluster = cluster_sizes[chunk_canonical] > 1
+            if in_cluster.any():
+                members = chunk[in_cluster]
+                pd.DataFrame({
+                    "cluster": chunk_canonical[in_cluster],
+                    "row": rows[in_cluster],
+                    "canonical": chunk_canonical[in_cluster] == rows[in_cluster],
+                    "job_title": members["job_title"].to_numpy(),
+                    "location": members["location"].to_numpy(),
+                    "experience": members["experience"].to_numpy(),
+                }).to_csv(report, header=False, index=False)
+            start += len(chunk)
+
+        # An input with no rows still gets a header
+        if header:
+            pd.read_csv(input_path, dtype=str, nrows=0).to_csv(out, index=False)
+
+
+# Writes output_path with one canonical row per near-duplicate cluster of
+# input_path, plus a report of all clusters with more than one row. Memory
+# is one chunk or one partition at a time plus two small per-row arrays.
+# Always a full pass over input_path, which is why preprocess.py only runs
+# it with --near-dedup. Returns stats.
+def near_dedup(input_path=INPUT_PATH, output_path=OUTPUT_PATH, report_path=REPORT_PATH,
+               chunk_size=CHUNK_SIZE, partitions=PARTITIONS, threshold=THRESHOLD):
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(output_path) or ".") as spill_dir:
+        rows = spill_partitions(input_path, spill_dir, chunk_size, partitions)
+
+        canonical = np.arange(rows, dtype=np.int64)
+        for p in range(partitions):
+            records = np.fromfile(os.path.join(spill_dir, f"{p:03d}.bin"), dtype=RECORD)
+            if len(records):
+                partition_rows, partition_canonical = cluster_partition(records, threshold)
+                canonical[partition_rows] = partition_canonical
+
+    cluster_sizes = np.bincount(canonical, minlength=rows)
+    write_output(input_path, output_path, report_path, canonical, cluster_sizes, chunk_size)
+
+    return {
+        "rows_in": rows,
+        "rows_out": int(np.count_nonzero(canonical == np.arange(rows))),
+        "clusters": int(np.count_nonzero(cluster_sizes > 1)),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def print_stats(stats):
+    print(f"🧹 Near-duplicates: {stats['rows_in'] - stats['rows_out']} of {stats['rows_in']} rows "
+          f"removed in {stats['clusters']} clusters ({stats['seconds']:.2f}s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Remove near-duplicate job postings")
+    parser.add_argument("--input", default=INPUT_PATH)
+    parser.add_argument("--output", default=OUTPUT_PATH)
+    parser.add_argument("--report", default=REPORT_PATH)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--partitions", type=int, default=PARTITIONS,
+                        help="spill files; memory per partition is about rows / partitions")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    args = parser.parse_args()
+
+    stats = near_dedup(args.input, args.output, args.report, args.chunk_size,
+                       args.partitions, args.threshold)
+    print_stats(stats)
+    print("📄 File created:", args.output)
+    print("📄 Report:", args.report)
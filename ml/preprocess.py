@@ -1,5 +1,14 @@
-import pandas as pd
+import argparse
+import hashlib
+import json
 import os
+import sqlite3
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from near_dedup import REPORT_PATH, near_dedup, print_stats
+from sources import OUTPUT_COLUMNS, SOURCE_ADAPTERS, discover_sources, map_chunk
 
 # -----------------------------
 # Paths
@@ -7,69 +16,302 @@ import os
 RAW_DATA_PATH = "Data/Raw"
 PROCESSED_DATA_PATH = "Data/Processed"
 
-os.makedirs(PROCESSED_DATA_PATH, exist_ok=True)
-
 output_path = os.path.join(PROCESSED_DATA_PATH, "jobs_master.csv")
+# Exact-dedup output, input of the near-duplicate stage (--near-dedup only)
+exact_output_path = os.path.join(PROCESSED_DATA_PATH, "jobs_exact.csv")
+MANIFEST_PATH = os.path.join(PROCESSED_DATA_PATH, "manifest.json")
+DIGEST_DB_PATH = os.path.join(PROCESSED_DATA_PATH, "row_digests.sqlite")
 
-dfs = []
-
-# =============================
-# 1. NAUKRI DATASET
-# Columns:
-# ['Job_Role', 'Company', 'Location', 'Job Experience', 'Skills/Description']
-# =============================
-naukri_path = os.path.join(RAW_DATA_PATH, "naukri_data_science_jobs_india.csv")
-
-if os.path.exists(naukri_path):
-    naukri_df = pd.read_csv(naukri_path)
-
-    naukri_clean = pd.DataFrame({
-        "job_title": naukri_df["Job_Role"],
-        "job_description": naukri_df["Skills/Description"],
-        "skills_extracted": naukri_df["Skills/Description"],
-        "location": naukri_df["Location"],
-        "experience": naukri_df["Job Experience"],
-        "role_category": "Data Science",
-        "source_dataset": "Naukri"
-    })
+CHUNK_SIZE = 50_000
+
+# -----------------------------
+# Dedup store
+# 64-bit row digests kept in SQLite on disk, so memory does not grow
+# with the number of distinct rows seen. Each digest remembers the raw
+# file that contributed it, so a file's rows can be retracted.
+# -----------------------------
+class DigestStore:
+
+    def __init__(self, path):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS digests (digest INTEGER PRIMARY KEY, source TEXT)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS digests_source ON digests (source)")
+        self.conn.execute("CREATE TEMP TABLE batch (digest INTEGER PRIMARY KEY)")
+
+    # Marks the digests as seen; True where a row was not seen before
+    # (within this batch, only its first occurrence counts as new)
+    def add_new(self, digests, source):
+        digests = pd.Series(digests)
+        first = ~digests.duplicated()
+        candidates = digests[first]
+
+        with self.conn:
+            self.conn.execute("DELETE FROM batch")
+            self.conn.executemany("INSERT INTO batch VALUES (?)", ((int(d),) for d in candidates))
+            existing = {
+                row[0] for row in
+                self.conn.execute("SELECT digest FROM batch JOIN digests USING (digest)")
+            }
+            new = first & ~digests.isin(existing)
+            self.conn.executemany(
+                "INSERT INTO digests VALUES (?, ?)", ((int(d), source) for d in digests[new])
+            )
+
+        return new.to_numpy()
+
+    def retract(self, sources):
+        with self.conn:
+            self.conn.executemany("DELETE FROM digests WHERE source = ?", ((s,) for s in sources))
+
+    def clear(self):
+        with self.conn:
+            self.conn.execute("DELETE FROM digests")
+
+    def close(self):
+        self.conn.close()
+
+
+def row_digests(df):
+    # uint64 row hashes viewed as int64 so SQLite can store them
+    return pd.util.hash_pandas_object(df, index=False).to_numpy().view("int64")
+
+
+# -----------------------------
+# Staging
+# Parsing and mapping raw files is the expensive part and is independent
+# per file, so it runs in a process pool. Each file is staged as Parquet
+# (one row group per chunk); dedup and append then happen serially in
+# discovery order, so the output matches a serial run exactly.
+# -----------------------------
+def stage_source(adapter_name, raw_path, staged_path, chunk_size):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    start = time.perf_counter()
+    adapter = SOURCE_ADAPTERS[adapter_name]
+    schema = pa.schema([(column, pa.string()) for column in OUTPUT_COLUMNS])
+    rows = 0
+
+    with pq.ParquetWriter(staged_path, schema) as writer:
+        for raw_chunk in pd.read_csv(raw_path, dtype=str, chunksize=chunk_size):
+            chunk = map_chunk(adapter, raw_chunk)
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            rows += len(chunk)
+
+    return {
+        "source": adapter_name,
+        "file": os.path.basename(raw_path),
+        "rows_read": rows,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def stage_sources(tasks, workers):
+    if workers <= 1 or len(tasks) <= 1:
+        return [stage_source(*task) for task in tasks]
+    with ProcessPoolExecutor(min(workers, len(tasks))) as pool:
+        return list(pool.map(stage_source, *zip(*tasks)))
 
-    dfs.append(naukri_clean)
-
-# =============================
-# 2. DATA SCIENCE SALARY DATASET
-# Columns:
-# ['job_title', 'job_category', 'experience_level', 'company_location', ...]
-# =============================
-ds_path = os.path.join(RAW_DATA_PATH, "data_science_job.csv")
-
-if os.path.exists(ds_path):
-    ds_df = pd.read_csv(ds_path)
-
-    ds_clean = pd.DataFrame({
-        "job_title": ds_df["job_title"],
-        # CREATE description manually (IMPORTANT)
-        "job_description": ds_df["job_title"] + " | " + ds_df["job_category"],
-        "skills_extracted": ds_df["job_category"],
-        "location": ds_df["company_location"],
-        "experience": ds_df["experience_level"],
-        "role_category": ds_df["job_category"],
-        "source_dataset": "DS_Salary_Dataset"
-    })
 
-    dfs.append(ds_clean)
+def read_staged_chunks(staged_path):
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(staged_path)
+    for i in range(parquet_file.num_row_groups):
+        yield parquet_file.read_row_group(i).to_pandas()
+
 
 # -----------------------------
-# Merge & Save
+# Manifest
+# Records, per raw file in ingestion order, its fingerprint and the row /
+# byte range it contributed to jobs_master.csv. "version" is bumped on
+# every change so downstream caches know when to refresh.
 # -----------------------------
-if len(dfs) == 0:
-    raise Exception("❌ No datasets found in Data/Raw")
+def file_fingerprint(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest.hexdigest()}
+
+
+def is_unchanged(path, entry):
+    if not os.path.exists(path):
+        return False
+    stat = os.stat(path)
+    if stat.st_size != entry["size"]:
+        return False
+    if stat.st_mtime_ns == entry["mtime_ns"]:
+        return True
+    # Touched but maybe not edited: fall back to the content hash
+    return file_fingerprint(path)["sha256"] == entry["sha256"]
+
+
+def load_manifest(path=MANIFEST_PATH):
+    if not os.path.exists(path):
+        return {"version": 0, "status": "empty", "files": []}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(manifest, path=MANIFEST_PATH):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def ingest_file(path, staged_path, source, name, out, store, row_start):
+    byte_start = out.tell()
+    rows = 0
+    for chunk in read_staged_chunks(staged_path):
+        new_rows = chunk[store.add_new(row_digests(chunk), name)]
+        new_rows.to_csv(out, header=False, index=False)
+        rows += len(new_rows)
+    out.flush()
+
+    entry = file_fingerprint(path)
+    entry.update({
+        "name": name,
+        "source": source,
+        "row_start": row_start,
+        "row_end": row_start + rows,
+        "byte_start": byte_start,
+        "byte_end": out.tell(),
+    })
+    return entry
+
+
+# Brings jobs_master.csv in line with Data/Raw. Files already ingested and
+# unchanged keep their rows; from the first removed or changed file onwards
+# the output is truncated, those files' digests retracted, and the remaining,
+# changed and new files appended again. Returns (manifest, per-file stats).
+def update_processed(raw_dir=RAW_DATA_PATH, output=output_path, chunk_size=CHUNK_SIZE,
+                     full=False, workers=1, manifest_path=MANIFEST_PATH,
+                     digest_path=DIGEST_DB_PATH):
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+
+    found, unmatched = discover_sources(raw_dir)
+    for name in unmatched:
+        print(f"⚠️ No raw files for source {name} ({SOURCE_ADAPTERS[name]['pattern']})")
+    if len(found) == 0:
+        raise Exception("❌ No datasets found in Data/Raw")
+    sources = {file_name: source for source, file_name in found}
+
+    manifest = load_manifest(manifest_path)
+    # An interrupted run leaves "updating" behind, so start over; so does a
+    # manifest written for a different output file
+    if full or manifest["status"] != "ready" or not os.path.exists(output) \
+            or not os.path.exists(digest_path) \
+            or manifest.get("output", os.path.basename(output)) != os.path.basename(output):
+        manifest = {"version": manifest["version"], "status": "empty", "files": []}
+    manifest["output"] = os.path.basename(output)
+
+    kept = []
+    for entry in manifest["files"]:
+        path = os.path.join(raw_dir, entry["name"])
+        if sources.get(entry["name"]) != entry.get("source") or not is_unchanged(path, entry):
+            break
+        # Remember the new mtime of touched-but-identical files
+        entry["mtime_ns"] = os.stat(path).st_mtime_ns
+        kept.append(entry)
+
+    dropped = manifest["files"][len(kept):]
+    kept_names = {entry["name"] for entry in kept}
+    pending = [entry["name"] for entry in dropped if entry["name"] in sources]
+    pending += [name for _, name in found if name not in kept_names and name not in pending]
+
+    if not dropped and not pending:
+        if manifest["files"]:
+            save_manifest(manifest, manifest_path)
+        return manifest, []
+
+    manifest["status"] = "updating"
+    save_manifest(manifest, manifest_path)
+
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(output)) as staging_dir:
+        tasks = [
+            (sources[name], os.path.join(raw_dir, name),
+             os.path.join(staging_dir, f"{i:04d}.parquet"), chunk_size)
+            for i, name in enumerate(pending)
+        ]
+        stats = stage_sources(tasks, workers)
+
+        store = DigestStore(digest_path)
+        try:
+            if kept:
+                store.retract(entry["name"] for entry in dropped)
+                mode = "r+"
+            else:
+                store.clear()
+                mode = "w"
+
+            with open(output, mode, newline="", encoding="utf-8") as out:
+                if kept:
+                    out.seek(kept[-1]["byte_end"])
+                    out.truncate()
+                else:
+                    pd.DataFrame(columns=OUTPUT_COLUMNS).to_csv(out, index=False)
+
+                row_start = kept[-1]["row_end"] if kept else 0
+                for (source, path, staged_path, _), file_stats in zip(tasks, stats):
+                    entry = ingest_file(path, staged_path, source, os.path.basename(path),
+                                        out, store, row_start)
+                    file_stats["rows_kept"] = entry["row_end"] - entry["row_start"]
+                    kept.append(entry)
+                    row_start = entry["row_end"]
+        finally:
+            store.close()
+
+    manifest = {"version": manifest["version"] + 1, "status": "ready",
+                "output": manifest["output"], "files": kept}
+    save_manifest(manifest, manifest_path)
+    for entry in dropped:
+        if entry["name"] not in sources:
+            stats.append({"source": entry.get("source"), "file": entry["name"], "retracted": True})
+    return manifest, stats
+
 
-final_df = pd.concat(dfs, ignore_index=True)
-final_df.fillna("", inplace=True)
-final_df.drop_duplicates(inplace=True)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build jobs_master.csv from the raw datasets")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE,
+                        help="rows read per chunk from each raw file")
+    parser.add_argument("--full", action="store_true",
+                        help="ignore the manifest and rebuild from scratch")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="processes used to parse and map raw files")
+    parser.add_argument("--near-dedup", action="store_true",
+                        help="also remove near-duplicate postings; rewrites the whole of "
+                             "jobs_master.csv on every change instead of appending")
+    args = parser.parse_args()
 
-final_df.to_csv(output_path, index=False)
+    # By default only exact duplicates are removed, and jobs_master.csv is
+    # updated in place (a new raw file is an append). The near-duplicate
+    # stage clusters the whole corpus, so with --near-dedup any change costs
+    # a full read of jobs_exact.csv and a full rewrite of jobs_master.csv.
+    if not args.near_dedup:
+        manifest, stats = update_processed(chunk_size=args.chunk_size, full=args.full,
+                                           workers=args.workers)
+    else:
+        manifest, stats = update_processed(output=exact_output_path, chunk_size=args.chunk_size,
+                                           full=args.full, workers=args.workers)
+        if stats or not os.path.exists(output_path) \
+                or os.path.getmtime(output_path) < os.path.getmtime(exact_output_path):
+            print_stats(near_dedup(exact_output_path, output_path, REPORT_PATH, args.chunk_size))
 
-print("✅ preprocess.py ran successfully")
-print("📄 File created:", output_path)
-print("📊 Total rows:", len(final_df))
+    print("✅ preprocess.py ran successfully")
+    print("📄 File created:", output_path)
+    if not stats:
+        print("🔁 Files processed: none (up to date)")
+    for file_stats in stats:
+        if file_stats.get("retracted"):
+            print(f"   🗑️ {file_stats['source']:<20} {file_stats['file']}: retracted")
+        else:
+            print(f"   ⏱️ {file_stats['source']:<20} {file_stats['file']}: "
+                  f"{file_stats['rows_read']} rows read, {file_stats['rows_kept']} kept, "
+                  f"{file_stats['seconds']:.2f}s")
+    print("🏷️ Manifest version:", manifest["version"])
+    print("📊 Total rows:", manifest["files"][-1]["row_end"] if manifest["files"] else 0)
@@ -1,8 +1,19 @@
 import pandas as pd
 import re
 
+# Skills whose name is mostly punctuation; rewritten to words before the
+# punctuation is stripped, or "c++" and "c#" would both end up as "c"
+# and ".net" as the word "net"
+PROTECTED_TOKENS = [
+    (re.compile(r'(?<![a-z0-9])c\s*\+\s*\+'), ' cplusplus '),
+    (re.compile(r'(?<![a-z0-9])c\s*#'), ' csharp '),
+    (re.compile(r'(?<![a-z0-9])\.net\b'), ' dotnet '),
+]
+
 def clean_text(text):
     text = text.lower()
+    for pattern, replacement in PROTECTED_TOKENS:
+        text = pattern.sub(replacement, text)
     text = re.sub(r'[^a-z0-9, ]', '', text)
     return text
 
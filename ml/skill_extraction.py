@@ -1,25 +1,107 @@
-from collections import Counter
-from preprocessing import load_and_clean_data
+import argparse
 import pandas as pd
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from aho_corasick import AhoCorasick
+from preprocessing import clean_text, load_and_clean_data
+
+TAXONOMY_PATH = "Data/Reference/skill_taxonomy.csv"
+OUTPUT_PATH = "Data/Processed/skills_output.csv"
+
+BATCH_SIZE = 2000
+
+
+def load_taxonomy(path=TAXONOMY_PATH):
+    taxonomy = pd.read_csv(path, dtype={"skill": str, "synonyms": str}, keep_default_na=False)
+    return taxonomy
+
+
+# Form a taxonomy term is matched in: clean_text() output with runs of
+# whitespace collapsed ("No - SQL" -> "no sql")
+def match_key(term):
+    return " ".join(clean_text(term).replace(",", " ").split())
+
+
+# Terms that collapse to a single character would be ambiguous and are
+# only kept when they were one character already.
+def taxonomy_patterns(taxonomy):
+    for skill_id, skill, synonyms in taxonomy[["skill_id", "skill", "synonyms"]].itertuples(index=False):
+        terms = [skill] + [s for s in synonyms.split("|") if s]
+        for term in terms:
+            pattern = match_key(term)
+            if len(pattern) >= 2 or len(term.strip()) == 1:
+                yield pattern, skill_id
+
+
+class SkillExtractor:
+
+    def __init__(self, taxonomy):
+        self.skills = dict(zip(taxonomy["skill_id"], taxonomy["skill"]))
+        self.automaton = AhoCorasick(taxonomy_patterns(taxonomy))
+
+    # Sorted, de-duplicated skill IDs found in one cleaned description.
+    # Whitespace is collapsed like the patterns, since clean_text() leaves
+    # a double space where it drops punctuation ("no - sql" -> "no  sql").
+    def extract(self, text):
+        if not isinstance(text, str):
+            return []
+        text = " ".join(text.split())
+        return sorted({skill_id for _, _, skill_id in self.automaton.find_words(text)})
 
-SKILLS = [
-    "python", "machine learning", "sql", "aws",
-    "deep learning", "nlp", "docker", "kubernetes"
-]
+    def extract_batch(self, texts):
+        return [self.extract(text) for text in texts]
 
-def generate_skill_counts():
-    df = load_and_clean_data()
-    counter = Counter()
 
-    for desc in df["clean_description"]:
-        for skill in SKILLS:
-            if skill in desc:
-                counter[skill] += 1
+# -----------------------------
+# Process pool workers
+# -----------------------------
+_worker_extractor = None
+
+
+def _init_worker(taxonomy_path):
+    global _worker_extractor
+    _worker_extractor = SkillExtractor(load_taxonomy(taxonomy_path))
+
+
+def _extract_batch(texts):
+    return _worker_extractor.extract_batch(texts)
+
+
+def extract_skills(texts, taxonomy_path=TAXONOMY_PATH, batch_size=BATCH_SIZE, workers=1):
+    texts = list(texts)
+    batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+
+    if workers <= 1 or len(batches) <= 1:
+        extractor = SkillExtractor(load_taxonomy(taxonomy_path))
+        return [ids for batch in batches for ids in extractor.extract_batch(batch)]
+
+    # Each worker builds its automaton once; map keeps batch order
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(taxonomy_path,)) as pool:
+        return [ids for batch_ids in pool.map(_extract_batch, batches) for ids in batch_ids]
+
+
+# Returns (skill counts, skill ID list per row of df); df is not modified
+def generate_skill_counts(df=None, taxonomy_path=TAXONOMY_PATH, workers=1):
+    if df is None:
+        df = load_and_clean_data()
+
+    skill_ids = extract_skills(df["clean_description"], taxonomy_path, workers=workers)
+
+    counter = Counter(skill_id for ids in skill_ids for skill_id in ids)
+    skills = load_taxonomy(taxonomy_path).set_index("skill_id")["skill"]
+
+    output_df = pd.DataFrame(
+        [(skills[skill_id], count) for skill_id, count in counter.most_common()],
+        columns=["Skill", "Count"]
+    )
+    return output_df, skill_ids
 
-    output_df = pd.DataFrame(counter.items(), columns=["Skill", "Count"])
-    return output_df
 
 if __name__ == "__main__":
-    output = generate_skill_counts()
-    output.to_csv("Data/Processed/skills_output.csv", index=False)
+    parser = argparse.ArgumentParser(description="Count taxonomy skills across job descriptions")
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    output, _ = generate_skill_counts(workers=args.workers)
+    output.to_csv(OUTPUT_PATH, index=False)
     print(output)
@@ -0,0 +1,92 @@
+import fnmatch
+import os
+import pandas as pd
+
+# jobs_master schema, in output column order
+OUTPUT_COLUMNS = [
+    "job_title", "job_description", "skills_extracted", "location",
+    "experience", "role_category", "source_dataset"
+]
+
+# -----------------------------
+# Adapter registry
+# Each adapter declares the raw files it owns (glob pattern inside
+# Data/Raw) and how every jobs_master column is derived: a raw column
+# name, const(value), or a function of the raw chunk. Registration
+# order is the merge order.
+# -----------------------------
+SOURCE_ADAPTERS = {}
+
+
+def const(value):
+    return lambda df: value
+
+
+def register_source(name, pattern, columns):
+    missing = [col for col in OUTPUT_COLUMNS if col not in columns]
+    if missing:
+        raise ValueError(f"Source {name} does not map columns: {missing}")
+
+    SOURCE_ADAPTERS[name] = {"name": name, "pattern": pattern, "columns": columns}
+
+
+def map_chunk(adapter, raw_df):
+    mapped = {}
+    for column in OUTPUT_COLUMNS:
+        rule = adapter["columns"][column]
+        mapped[column] = raw_df[rule] if isinstance(rule, str) else rule(raw_df)
+    return pd.DataFrame(mapped, index=raw_df.index)[OUTPUT_COLUMNS].fillna("")
+
+
+# (adapter name, file name) pairs in deterministic order, plus the adapters
+# that matched no file at all
+def discover_sources(raw_dir):
+    files = sorted(os.listdir(raw_dir)) if os.path.isdir(raw_dir) else []
+    found = []
+    unmatched = []
+    for name, adapter in SOURCE_ADAPTERS.items():
+        matches = fnmatch.filter(files, adapter["pattern"])
+        if not matches:
+            unmatched.append(name)
+        found.extend((name, file_name) for file_name in matches)
+    return found, unmatched
+
+
+# =============================
+# 1. NAUKRI DATASET
+# Columns:
+# ['Job_Role', 'Company', 'Location', 'Job Experience', 'Skills/Description']
+# =============================
+register_source(
+    "Naukri",
+    pattern="naukri*.csv",
+    columns={
+        "job_title": "Job_Role",
+        "job_description": "Skills/Description",
+        "skills_extracted": "Skills/Description",
+        "location": "Location",
+        "experience": "Job Experience",
+        "role_category": const("Data Science"),
+        "source_dataset": const("Naukri"),
+    },
+)
+
+# =============================
+# 2. DATA SCIENCE SALARY DATASET
+# Columns:
+# ['job_title', 'job_category', 'experience_level', 'company_location', ...]
+# =============================
+register_source(
+    "DS_Salary_Dataset",
+    pattern="data_science_job*.csv",
+    columns={
+        "job_title": "job_title",
+        # CREATE description manually (IMPORTANT)
+        "job_description": lambda df: df["job_title"] + " | " + df["job_category"],
+        "skills_extracted": "job_category",
+        "location": "company_location",
+        "experience": "experience_level",
+        "role_category": "job_category",
+        "source_dataset": const("DS_Salary_Dataset"),
+    },
+)
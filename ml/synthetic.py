@@ -0,0 +1,200 @@
+import argparse
+import os
+import time
+import numpy as np
+import pandas as pd
+from sources import OUTPUT_COLUMNS, SOURCE_ADAPTERS, discover_sources, map_chunk
+
+# -----------------------------
+# Paths
+# -----------------------------
+RAW_DATA_PATH = "Data/Raw"
+OUTPUT_DIR = "Data/Synthetic"
+
+CHUNK_SIZE = 500_000
+
+# Share of skills replaced by a skill drawn from the overall frequency, so
+# generated lists are not verbatim copies of real ones
+SKILL_SWAP_RATE = 0.15
+# Sigma of the log-normal factor applied to salaries
+SALARY_NOISE = 0.10
+
+# -----------------------------
+# Per-source sampling spec
+# "joint" columns are drawn together from one real row, keeping e.g. a
+# title with its skills and a salary with its currency. Every other raw
+# column is drawn independently from its own value frequencies (missing
+# values and messy strings included). "skills" is a ", "-separated list
+# rebuilt from the joint row's list, "salary" columns get noise.
+# -----------------------------
+SOURCE_SPECS = {
+    "Naukri": {
+        "joint": ["Job_Role", "Skills/Description"],
+        "skills": "Skills/Description",
+    },
+    "DS_Salary_Dataset": {
+        "joint": ["job_title", "job_category", "salary_currency", "salary", "salary_in_usd"],
+        "salary": ["salary", "salary_in_usd"],
+    },
+}
+
+
+def synthetic_file_name(adapter):
+    # "naukri*.csv" -> "naukri_synthetic.csv", so preprocess.py picks it up
+    return adapter["pattern"].replace("*", "_synthetic")
+
+
+def frequencies(series):
+    counts = series.value_counts(dropna=False)
+    return counts.index.to_numpy(dtype=object), (counts / counts.sum()).to_numpy()
+
+
+class SourceProfile:
+
+    def __init__(self, raw_df, spec):
+        self.columns = list(raw_df.columns)
+        self.spec = spec
+        self.joint = {col: raw_df[col].to_numpy(dtype=object) for col in spec["joint"]}
+        self.rows = len(raw_df)
+        self.marginals = {
+            col: frequencies(raw_df[col]) for col in self.columns if col not in spec["joint"]
+        }
+
+        # Skill lists as one flat array of vocabulary codes plus per-row
+        # offsets, so sampling is a gather instead of a loop over lists
+        if "skills" in spec:
+            lists = raw_df[spec["skills"]].fillna("").str.split(",")
+            tokens = lists.explode().str.strip()
+            tokens = tokens[tokens != ""]
+            codes, vocabulary = pd.factorize(tokens)
+
+            self.skill_lengths = tokens.groupby(level=0).size().reindex(
+                range(self.rows), fill_value=0
+            ).to_numpy()
+            self.skill_offsets = np.cumsum(self.skill_lengths) - self.skill_lengths
+            self.skill_codes = codes
+            self.skill_vocabulary = vocabulary.to_numpy(dtype=object)
+            counts = np.bincount(codes, minlength=len(vocabulary))
+            self.skill_probs = counts / counts.sum()
+
+    def sample_skills(self, template, rng):
+        lengths = self.skill_lengths[template]
+        ends = np.cumsum(lengths)
+        starts = ends - lengths
+        positions = np.repeat(self.skill_offsets[template] - starts, lengths) + np.arange(ends[-1] if len(ends) else 0)
+        codes = self.skill_codes[positions]
+
+        swap = rng.random(codes.size) < SKILL_SWAP_RATE
+        codes[swap] = rng.choice(len(self.skill_vocabulary), size=int(swap.sum()), p=self.skill_probs)
+
+        tokens = self.skill_vocabulary[codes].tolist()
+        skills = np.array([", ".join(tokens[s:e]) for s, e in zip(starts, ends)], dtype=object)
+        skills[lengths == 0] = np.nan
+        return skills
+
+    def sample(self, n, rng):
+        template = rng.integers(0, self.rows, size=n)
+        data = {col: values[template] for col, values in self.joint.items()}
+
+        for col, (values, probs) in self.marginals.items():
+            data[col] = values[rng.choice(len(values), size=n, p=probs)]
+
+        if "skills" in self.spec:
+            data[self.spec["skills"]] = self.sample_skills(template, rng)
+
+        if "salary" in self.spec:
+            factor = rng.lognormal(0.0, SALARY_NOISE, size=n)
+            for col in self.spec["salary"]:
+                salary = pd.to_numeric(pd.Series(data[col]), errors="coerce").to_numpy() * factor
+                data[col] = pd.Series(np.round(salary)).astype("Int64").to_numpy(dtype=object)
+
+        return pd.DataFrame(data)[self.columns]
+
+
+# Fits one profile per registered source that has a spec and raw files.
+# Returns {source: (profile, real row count)}.
+def fit_profiles(raw_dir=RAW_DATA_PATH):
+    found, _ = discover_sources(raw_dir)
+    frames = {}
+    for source, file_name in found:
+        if source in SOURCE_SPECS:
+            frames.setdefault(source, []).append(
+                pd.read_csv(os.path.join(raw_dir, file_name), dtype=str)
+            )
+
+    profiles = {}
+    for source, parts in frames.items():
+        raw_df = pd.concat(parts, ignore_index=True)
+        profiles[source] = (SourceProfile(raw_df, SOURCE_SPECS[source]), len(raw_df))
+    if not profiles:
+        raise Exception(f"❌ No raw datasets to profile in {raw_dir}")
+    return profiles
+
+
+# Writes `rows` synthetic jobs, split across sources in their real
+# proportions, as raw files (native column layout, Data/Raw naming) and/or
+# a jobs_master.csv built through the same source adapters as
+# preprocess.py (without its dedup step). Only one chunk per source is in
+# memory at a time. The same seed and chunk size give the same output.
+def generate(rows, out_dir=OUTPUT_DIR, seed=42, chunk_size=CHUNK_SIZE,
+             raw=True, master=True, raw_dir=RAW_DATA_PATH):
+    profiles = fit_profiles(raw_dir)
+    real_total = sum(real_rows for _, real_rows in profiles.values())
+
+    raw_out = os.path.join(out_dir, "Raw")
+    master_path = os.path.join(out_dir, "Processed", "jobs_master.csv")
+    if raw:
+        os.makedirs(raw_out, exist_ok=True)
+    if master:
+        os.makedirs(os.path.dirname(master_path), exist_ok=True)
+        pd.DataFrame(columns=OUTPUT_COLUMNS).to_csv(master_path, index=False)
+
+    stats = []
+    remaining = rows
+    sources = list(profiles)
+    for source_index, source in enumerate(sources):
+        profile, real_rows = profiles[source]
+        if source_index == len(sources) - 1:
+            source_rows = remaining
+        else:
+            source_rows = round(rows * real_rows / real_total)
+        remaining -= source_rows
+
+        adapter = SOURCE_ADAPTERS[source]
+        raw_path = os.path.join(raw_out, synthetic_file_name(adapter))
+        start = time.perf_counter()
+
+        for chunk_index, offset in enumerate(range(0, source_rows, chunk_size)):
+            rng = np.random.default_rng([seed, source_index, chunk_index])
+            chunk = profile.sample(min(chunk_size, source_rows - offset), rng)
+            if raw:
+                chunk.to_csv(raw_path, mode="w" if offset == 0 else "a",
+                             header=offset == 0, index=False)
+            if master:
+                map_chunk(adapter, chunk).to_csv(master_path, mode="a", header=False, index=False)
+
+        stats.append({"source": source, "rows": source_rows,
+                      "seconds": time.perf_counter() - start})
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic job-market data for scale tests")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--out", default=OUTPUT_DIR)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE,
+                        help="rows generated and written per chunk")
+    parser.add_argument("--no-raw", action="store_true", help="skip the raw source files")
+    parser.add_argument("--no-master", action="store_true", help="skip jobs_master.csv")
+    args = parser.parse_args()
+
+    stats = generate(args.rows, args.out, args.seed, args.chunk_size,
+                     raw=not args.no_raw, master=not args.no_master)
+
+    print("✅ synthetic.py ran successfully")
+    print("📂 Output:", args.out)
+    for source_stats in stats:
+        rate = source_stats["rows"] / source_stats["seconds"] if source_stats["seconds"] else 0
+        print(f"   {source_stats['source']:<20} {source_stats['rows']:>12,} rows  "
+              f"{source_stats['seconds']:7.1f}s  ({rate:,.0f} rows/s)")